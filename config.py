@@ -49,6 +49,20 @@ RISK_DECAY_AMOUNT = 1       # Decrease risk by 1 point each decay cycle
 
 # Simulation timing: Interval between activity simulations
 SIMULATION_INTERVAL = 1200  # 1.2 seconds between activities
+SIMULATION_DRAW_BATCH = 256  # Random user/activity/sentiment draws generated per refill
+
+# Simulated events are saved to MongoDB in batches rather than one insert per tick
+EVENT_BATCH_SIZE = 100  # Save as soon as this many simulated events are queued
+EVENT_FLUSH_INTERVAL = 2000  # Save any queued simulated events at least this often (ms)
+EVENT_LOAD_BATCH_SIZE = 1000  # Events per insert when loading a file or URL
+DB_STATUS_INTERVAL = 5000  # How often (ms) the database status indicator is refreshed
+
+# Log table limits: the tables only show the newest rows, while a bounded
+# history (used for CSV export) keeps older rows off the widget
+MAX_ACTIVITY_ROWS = 500     # Rows kept in the activity log Treeview
+MAX_INCIDENT_ROWS = 500     # Rows kept in the incident log Treeview
+LOG_HISTORY_LIMIT = 10000   # Rows kept in memory per log for export
+EXPORT_POLL_INTERVAL = 100  # How often (ms) the GUI checks for a finished background CSV export
 
 # User status constants: Define possible user account states
 USER_STATUS_ACTIVE = "ACTIVE"  # User can accumulate risk from activities
@@ -65,16 +79,23 @@ USER_STATUS_LOCKED = "LOCKED"  # User is locked and cannot accumulate risk
 # The security score serves as a positive reinforcement mechanism to promote
 # security-conscious behavior in the organization.
 
-SECURITY_POINTS_NORMAL_ACTIVITY = 1      # Points awarded for normal activities (0 risk)
+SECURITY_POINTS_NORMAL_ACTIVITY = 1.0    # Points awarded for normal activities (0 risk)
 SECURITY_POINTS_LOW_RISK_ACTIVITY = 0.5  # Points awarded for low-risk activities (5 points)
 SECURITY_POINTS_PER_DECAY_CYCLE = 0.5   # Points awarded when risk decays (good behavior)
 
 # AI Anomaly Detection Configuration
+# Detection method: "isolation_forest" (default) or "robust_zscore", a cheaper
+# median/MAD model on the user risk score kept for A/B comparison
+AI_DETECTION_METHOD = "isolation_forest"
 # Isolation Forest parameters for lightweight, academic-friendly implementation
-AI_CONTAMINATION = 0.1  # Expected proportion of anomalies (10%)
+AI_CONTAMINATION = 0.1  # Expected proportion of anomalies (10%); also sets the z-score cutoff
 AI_MIN_SAMPLES = 10     # Minimum samples needed before training model
 AI_ANOMALY_RISK_PENALTY = 8  # Risk points added when AI detects anomaly
 AI_RETRAIN_INTERVAL = 50  # Retrain model after this many activities
+AI_TRAINING_POLL_INTERVAL = 50  # How often (ms) the GUI checks for a finished background training job
+# Training history is a ring buffer holding the last ~10 retrain intervals of
+# per-user samples, so memory and retrain time stay flat over long sessions
+AI_MAX_HISTORY = 10 * AI_RETRAIN_INTERVAL * len(USERS)
 
 # Sentiment Analysis Configuration
 # TextBlob sentiment analysis for communication monitoring
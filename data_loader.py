@@ -8,7 +8,7 @@ Enhanced Event Format:
 - timestamp: ISO format datetime string
 - user_id: User identifier
 - activity: Activity type (must match RISK_RULES keys)
-- risk_increase: Optional risk points (if not provided, calculated from activity)
+- risk_increase: Optional risk points (if not provided, taken from RISK_RULES at load time)
 - details: Optional additional details about the activity
 - source: Optional source of the event (file/url/system)
 - ip_address: Optional IP address
@@ -16,14 +16,156 @@ Enhanced Event Format:
 - url: Optional URL for web-related activities
 """
 
+import codecs
 import csv
 import json
+import mmap
+from functools import lru_cache, partial
+from itertools import chain
+from operator import itemgetter
 import requests
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional
 from pathlib import Path
+from urllib.parse import urlparse
 import os
 
+import numpy as np
+
+from config import RISK_RULES, USERS
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; JSON is then parsed as one document
+    ijson = None
+
+# Read buffer for file and network loads (1 MiB): cuts read() calls on large event logs
+READ_BUFFER_SIZE = 1 << 20
+
+# Byte-order mark and whitespace skipped when sniffing a payload's format
+_LEADING_JUNK = b'\xef\xbb\xbf \t\r\n'
+
+# Valid user IDs and activity types, frozen once for per-row membership checks
+_USER_SET = frozenset(USERS)
+_ACTIVITY_SET = frozenset(RISK_RULES)
+
+# Accepted field names for user ID and activity, in priority order
+_USER_KEYS = ('user_id', 'user', 'username', 'userId')
+_ACTIVITY_KEYS = ('activity', 'action', 'event_type', 'type')
+
+# Envelope keys that wrap an event list in JSON payloads (e.g. {"events": [...]})
+_ENVELOPE_KEYS = ('events', 'data', 'records')
+
+# Timestamp field names, in priority order, and optional fields copied as-is
+_TIMESTAMP_KEYS = ('timestamp', 'time', 'date')
+_EXTRA_KEYS = ('severity', 'category', 'description', 'metadata')
+
+
+@lru_cache(maxsize=32)
+def _csv_event_builder(headers: tuple):
+    """
+    Build a row -> event function specialized to one CSV header layout.
+    Every column lookup is resolved to a position once, so rows are
+    normalized straight from the csv.reader list without an intermediate
+    dict. The result matches DataLoader._normalize_event on the row's dict.
+    
+    Args:
+        headers: CSV header row as a tuple
+    
+    Returns:
+        Function (row, source, default_timestamp) -> event dict or None
+    """
+    # Rows are cut or padded to one slot past the last header, that slot
+    # being None; columns missing from the header (or from a short row)
+    # read that None
+    absent = len(headers)
+    padding = [None] * (absent + 1)
+    col = {name: i for i, name in enumerate(headers)}
+    
+    def first_of(keys):
+        """Getter for the first non-empty value among keys, or None."""
+        # The two trailing absent slots keep itemgetter returning a tuple
+        values = itemgetter(*[col[key] for key in keys if key in col], absent, absent)
+        return lambda row: next(filter(None, values(row)), None)
+    
+    user_of = first_of(_USER_KEYS)
+    activity_of = first_of(_ACTIVITY_KEYS)
+    timestamp_of = first_of(_TIMESTAMP_KEYS)
+    source_col = col.get('source', absent)
+    risk_col = col.get('risk_increase', absent)
+    details_col = col.get('details', absent)
+    ip_cols = (col.get('ip_address', absent), col.get('ip', absent))
+    file_cols = (col.get('file_path', absent), col.get('filepath', absent))
+    url_col = col.get('url', absent)
+    extra_cols = tuple((key, col[key]) for key in _EXTRA_KEYS if key in col)
+    
+    # Repeated column names: rows that pass the user/activity check go
+    # through the dict path so the same value wins as before
+    repeated_headers = len(col) != len(headers)
+    
+    def build(row, source, default_timestamp):
+        width = len(row)
+        if width > absent:
+            # Cells past the last header are ignored, as with dict(zip(headers, row))
+            del row[absent:]
+        row += padding[len(row):]
+        
+        user_id = user_of(row)
+        if user_id not in _USER_SET:
+            return None
+        activity = activity_of(row)
+        if activity not in _ACTIVITY_SET:
+            return None
+        if repeated_headers:
+            return DataLoader._normalize_event(dict(zip(headers, row[:width])), source, default_timestamp)
+        
+        raw_source = row[source_col]
+        event = {
+            'timestamp': timestamp_of(row) or default_timestamp or datetime.now().isoformat(),
+            'user_id': user_id,
+            'activity': activity,
+            'source': source or ('unknown' if raw_source is None else raw_source),
+            'risk_increase': RISK_RULES[activity]
+        }
+        
+        risk_increase = row[risk_col]
+        if risk_increase:
+            event['risk_increase'] = int(risk_increase)
+        
+        details = row[details_col]
+        if details is not None:
+            event['details'] = details
+        
+        ip_address, ip = row[ip_cols[0]], row[ip_cols[1]]
+        if ip_address is not None or ip is not None:
+            event['ip_address'] = ip_address or ip
+        
+        file_path, filepath = row[file_cols[0]], row[file_cols[1]]
+        if file_path is not None or filepath is not None:
+            event['file_path'] = file_path or filepath
+        
+        url = row[url_col]
+        if url is not None:
+            event['url'] = url
+        
+        for key, i in extra_cols:
+            value = row[i]
+            if value is not None:
+                event[key] = value
+        
+        return event
+    
+    return build
+
 
 class DataLoader:
     """Handles loading events from URLs and local files."""
@@ -41,43 +183,113 @@ class DataLoader:
             Tuple of (events_list, error_message)
             events_list is empty if error occurred
         """
+        return DataLoader._collect(DataLoader.stream_from_url(url, timeout), "Error loading from URL")
+    
+    @staticmethod
+    def stream_from_url(url: str, timeout: int = 30) -> tuple[Iterator[Dict], Optional[str]]:
+        """
+        Open a URL (JSON or CSV) and lazily yield its events while the body
+        downloads, so large payloads are never held in memory at once.
+        
+        Args:
+            url: URL to fetch data from
+            timeout: Request timeout in seconds
+        
+        Returns:
+            Tuple of (events_iterator, error_message). Network errors are
+            returned here; parse errors are raised while iterating
+        """
         try:
-            response = requests.get(url, timeout=timeout)
+            response = requests.get(url, timeout=timeout, stream=True)
             response.raise_for_status()
+            if response.encoding is None:
+                response.encoding = 'utf-8'
             
-            content_type = response.headers.get('content-type', '').lower()
-            
-            # Try JSON first
-            if 'json' in content_type or url.endswith('.json'):
-                try:
-                    data = response.json()
-                    return DataLoader._parse_json_data(data, source=f"URL: {url}")
-                except json.JSONDecodeError:
-                    pass
-            
-            # Try CSV
-            if 'csv' in content_type or url.endswith('.csv'):
-                try:
-                    csv_data = response.text
-                    return DataLoader._parse_csv_data(csv_data, source=f"URL: {url}")
-                except Exception as e:
-                    return [], f"CSV parsing error: {str(e)}"
-            
-            # Try to auto-detect format
-            try:
-                data = response.json()
-                return DataLoader._parse_json_data(data, source=f"URL: {url}")
-            except:
-                try:
-                    csv_data = response.text
-                    return DataLoader._parse_csv_data(csv_data, source=f"URL: {url}")
-                except Exception as e:
-                    return [], f"Unable to parse data format: {str(e)}"
-                    
+            chunks = response.iter_content(READ_BUFFER_SIZE)
+            data_format, chunks = DataLoader._detect_url_format(url, response, chunks)
         except requests.exceptions.RequestException as e:
-            return [], f"Network error: {str(e)}"
-        except Exception as e:
-            return [], f"Error loading from URL: {str(e)}"
+            return iter(()), f"Network error: {str(e)}"
+        
+        source = f"URL: {url}"
+        if data_format == 'json':
+            return DataLoader._iter_json_stream(chunks, source), None
+        
+        csv_lines = DataLoader._iter_text_lines(chunks, response.encoding)
+        return DataLoader.iter_csv_events(csv_lines, source), None
+    
+    @staticmethod
+    def _detect_url_format(url: str, response, chunks: Iterator[bytes]) -> tuple[str, Iterator[bytes]]:
+        """
+        Decide once whether a URL response is JSON or CSV.
+        Uses the content type, then the URL path suffix, and finally sniffs
+        the first non-whitespace byte of the body ('[' or '{' means JSON).
+        Sniffing reads only the leading chunk(s) of the body, which are
+        handed back in front of the rest for the parser.
+        
+        Args:
+            url: URL the response was fetched from
+            response: requests.Response for the URL
+            chunks: Iterator over the response body
+        
+        Returns:
+            Tuple of ('json' or 'csv', iterator over the whole body)
+        """
+        content_type = response.headers.get('content-type', '').lower()
+        if 'json' in content_type:
+            return 'json', chunks
+        if 'csv' in content_type:
+            return 'csv', chunks
+        
+        url_path = urlparse(url).path.lower()
+        if url_path.endswith('.json'):
+            return 'json', chunks
+        if url_path.endswith('.csv'):
+            return 'csv', chunks
+        
+        head = []
+        for chunk in chunks:
+            head.append(chunk)
+            if chunk.lstrip(_LEADING_JUNK):
+                break
+        return DataLoader._sniff_format(b''.join(head)), chain(head, chunks)
+    
+    @staticmethod
+    def _iter_text_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+        """
+        Decode a byte stream and yield it line by line (line endings kept).
+        
+        Args:
+            chunks: Iterable of raw byte chunks
+            encoding: Text encoding of the stream
+        
+        Yields:
+            Text lines
+        """
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        pending = ''
+        for chunk in chunks:
+            lines = (pending + decoder.decode(chunk)).splitlines(keepends=True)
+            # The last piece continues in the next chunk unless it ends a line
+            pending = lines.pop() if lines and not lines[-1].endswith(('\n', '\r')) else ''
+            yield from lines
+        
+        tail = pending + decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+    
+    @staticmethod
+    def _sniff_format(head: bytes) -> str:
+        """
+        Guess the format of a payload from its first bytes.
+        
+        Args:
+            head: Leading bytes of the payload
+        
+        Returns:
+            'json' if the first non-whitespace byte is '[' or '{', else 'csv'
+        """
+        head = head.lstrip(_LEADING_JUNK)
+        return 'json' if head[:1] in (b'[', b'{') else 'csv'
     
     @staticmethod
     def load_from_file(file_path: str) -> tuple[List[Dict], Optional[str]]:
@@ -90,44 +302,145 @@ class DataLoader:
         Returns:
             Tuple of (events_list, error_message)
         """
+        return DataLoader._collect(DataLoader.stream_from_file(file_path), "Error reading file")
+    
+    @staticmethod
+    def stream_from_file(file_path: str) -> tuple[Iterator[Dict], Optional[str]]:
+        """
+        Lazily yield events from a local file (JSON or CSV), reading it as
+        the events are consumed. Files without a .json/.csv suffix are
+        detected from their first bytes.
+        
+        Args:
+            file_path: Path to the file
+        
+        Returns:
+            Tuple of (events_iterator, error_message). A missing or unreadable
+            file is reported here; parse errors are raised while iterating
+        """
         if not os.path.exists(file_path):
-            return [], f"File not found: {file_path}"
+            return iter(()), f"File not found: {file_path}"
+        
+        file_ext = Path(file_path).suffix.lower()
+        if file_ext == '.json':
+            data_format = 'json'
+        elif file_ext == '.csv':
+            data_format = 'csv'
+        else:
+            try:
+                with open(file_path, 'rb') as f:
+                    data_format = DataLoader._sniff_format(f.read(64))
+            except OSError as e:
+                return iter(()), f"Error reading file: {str(e)}"
+        
+        source = f"File: {file_path}"
+        if data_format == 'json':
+            return DataLoader._iter_json_file(file_path, source), None
+        return DataLoader._iter_csv_file(file_path, source), None
+    
+    @staticmethod
+    def _collect(stream: tuple[Iterator[Dict], Optional[str]], error_prefix: str) -> tuple[List[Dict], Optional[str]]:
+        """
+        Drain an event stream from stream_from_url/stream_from_file into a list.
         
+        Args:
+            stream: Tuple of (events_iterator, error_message)
+            error_prefix: Prefix for errors raised while iterating
+        
+        Returns:
+            Tuple of (events_list, error_message)
+        """
+        events, error = stream
+        if error:
+            return [], error
         try:
-            file_ext = Path(file_path).suffix.lower()
-            
-            if file_ext == '.json':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return DataLoader._parse_json_data(data, source=f"File: {file_path}")
-            
-            elif file_ext == '.csv':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    csv_data = f.read()
-                return DataLoader._parse_csv_data(csv_data, source=f"File: {file_path}")
-            
-            else:
-                # Try to auto-detect
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    return DataLoader._parse_json_data(data, source=f"File: {file_path}")
-                except:
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            csv_data = f.read()
-                        return DataLoader._parse_csv_data(csv_data, source=f"File: {file_path}")
-                    except Exception as e:
-                        return [], f"Unable to parse file format: {str(e)}"
-                        
+            return list(events), None
         except Exception as e:
-            return [], f"Error reading file: {str(e)}"
+            return [], f"{error_prefix}: {str(e)}"
+    
+    @staticmethod
+    def _iter_csv_file(file_path: str, source: str) -> Iterator[Dict]:
+        """Yield events from a CSV file, streamed line by line."""
+        with open(file_path, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER_SIZE) as f:
+            yield from DataLoader.iter_csv_events(f, source)
+    
+    @staticmethod
+    def _iter_json_file(file_path: str, source: str) -> Iterator[Dict]:
+        """Yield events from a JSON file, streamed when ijson is available."""
+        if ijson is not None:
+            with open(file_path, 'rb') as f:
+                yield from DataLoader._iter_json_stream(iter(partial(f.read, READ_BUFFER_SIZE), b''), source)
+        else:
+            yield from DataLoader._iter_json_document(DataLoader._read_json_file(file_path), source)
+    
+    @staticmethod
+    def _iter_json_stream(chunks: Iterable[bytes], source: str) -> Iterator[Dict]:
+        """
+        Yield events from JSON arriving as byte chunks. With ijson, a
+        top-level array is parsed incrementally, one event at a time; any
+        other payload (or any payload without ijson) is parsed as a whole.
+        
+        Args:
+            chunks: Iterable of raw JSON byte chunks
+            source: Source identifier for events
+        
+        Yields:
+            Normalized event dictionaries (invalid items are skipped)
+        """
+        chunks = iter(chunks)
+        head = b''
+        for head in chunks:
+            if head.strip():
+                break
+        
+        head = head.lstrip(_LEADING_JUNK)
+        if ijson is None or not head.startswith(b'['):
+            try:
+                data = _json_loads(head + b''.join(chunks))
+            except _JSONDecodeError as e:
+                raise ValueError(f"JSON parsing error: {str(e)}") from e
+            yield from DataLoader._iter_json_document(data, source)
+            return
+        
+        now_iso = datetime.now().isoformat()
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, 'item', use_float=True)
+        try:
+            for chunk in chain((head,), chunks):
+                parser.send(chunk)
+                yield from DataLoader._iter_json_events(items, source, now_iso)
+                del items[:]
+            parser.close()
+        except ijson.JSONError as e:
+            raise ValueError(f"JSON parsing error: {str(e)}") from e
+        yield from DataLoader._iter_json_events(items, source, now_iso)
+    
+    @staticmethod
+    def _read_json_file(file_path: str) -> any:
+        """
+        Parse a JSON file through a read-only memory map.
+        orjson parses the mapped pages in place, so the file is never copied
+        into a Python bytes object; the stdlib fallback needs one copy.
+        
+        Args:
+            file_path: Path to the JSON file
+        
+        Returns:
+            Parsed JSON data
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return _json_loads(b'')  # mmap rejects empty files; raise the usual decode error
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _json_loads(view if orjson is not None else view.tobytes())
     
     @staticmethod
     def _parse_json_data(data: any, source: str = "") -> tuple[List[Dict], Optional[str]]:
         """
         Parse JSON data into event list.
-        Supports both list of events and single event object.
+        Supports a list of events, a single event object, and event lists
+        wrapped in an "events", "data" or "records" envelope.
         
         Args:
             data: JSON data (list or dict)
@@ -136,64 +449,110 @@ class DataLoader:
         Returns:
             Tuple of (events_list, error_message)
         """
-        events = []
-        
         try:
-            # If it's a list of events
-            if isinstance(data, list):
-                for item in data:
-                    event = DataLoader._normalize_event(item, source)
-                    if event:
-                        events.append(event)
-            
-            # If it's a single event object
-            elif isinstance(data, dict):
-                event = DataLoader._normalize_event(data, source)
-                if event:
-                    events.append(event)
+            # If it's nested (e.g., {"events": [...]}), unwrap to the list
+            if isinstance(data, dict):
+                for key in _ENVELOPE_KEYS:
+                    if isinstance(data.get(key), list):
+                        data = data[key]
+                        break
             
-            # If it's nested (e.g., {"events": [...]})
-            elif isinstance(data, dict) and 'events' in data:
-                for item in data['events']:
-                    event = DataLoader._normalize_event(item, source)
-                    if event:
-                        events.append(event)
+            # A single event object is treated as a one-event list
+            if isinstance(data, dict):
+                data = [data]
             
+            events = list(DataLoader._iter_json_events(data, source)) if isinstance(data, list) else []
             return events, None
             
         except Exception as e:
             return [], f"JSON parsing error: {str(e)}"
     
     @staticmethod
-    def _parse_csv_data(csv_data: str, source: str = "") -> tuple[List[Dict], Optional[str]]:
+    def _iter_json_document(data: any, source: str) -> Iterator[Dict]:
+        """Yield the events of an already parsed JSON document."""
+        events, error = DataLoader._parse_json_data(data, source)
+        if error:
+            raise ValueError(error)
+        yield from events
+    
+    @staticmethod
+    def _iter_json_events(items: Iterable[any], source: str, default_timestamp: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield normalized events from parsed JSON array items.
+        
+        Args:
+            items: Iterable of parsed JSON values
+            source: Source identifier for events
+            default_timestamp: ISO timestamp for events without one
+                (defaults to the current time)
+        
+        Yields:
+            Normalized event dictionaries (non-objects and invalid events are skipped)
+        """
+        normalize = DataLoader._normalize_event
+        now_iso = default_timestamp or datetime.now().isoformat()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            event = normalize(item, source, now_iso)
+            if event:
+                yield event
+    
+    @staticmethod
+    def _parse_csv_data(csv_data: Iterable[str], source: str = "") -> tuple[List[Dict], Optional[str]]:
         """
         Parse CSV data into event list.
         Supports enhanced CSV format with multiple columns.
         
         Args:
-            csv_data: CSV string data
+            csv_data: Iterable of CSV lines (open file, response line iterator)
+                or a CSV string
             source: Source identifier for events
         
         Returns:
             Tuple of (events_list, error_message)
         """
-        events = []
-        
         try:
-            csv_reader = csv.DictReader(csv_data.splitlines())
-            
-            for row in csv_reader:
-                event = DataLoader._normalize_event(row, source)
-                if event:
-                    events.append(event)
-            
+            events = list(DataLoader.iter_csv_events(csv_data, source))
             return events, None
             
         except Exception as e:
             return [], f"CSV parsing error: {str(e)}"
     
     @staticmethod
-    def _normalize_event(raw_event: Dict, source: str = "") -> Optional[Dict]:
+    def iter_csv_events(csv_data: Iterable[str], source: str = "") -> Iterator[Dict]:
+        """
+        Lazily yield normalized events from CSV data, one row at a time.
+        Only the current row is held in memory, so large files can be
+        streamed straight from disk or the network.
+        
+        Args:
+            csv_data: Iterable of CSV lines or a CSV string
+            source: Source identifier for events
+        
+        Yields:
+            Normalized event dictionaries (invalid rows are skipped)
+        """
+        if isinstance(csv_data, str):
+            csv_data = csv_data.splitlines()
+        
+        reader = csv.reader(csv_data)
+        headers = next(reader, None)
+        if not headers:
+            return
+        
+        build = _csv_event_builder(tuple(headers))
+        now_iso = datetime.now().isoformat()
+        for row in reader:
+            if not row:
+                continue
+            
+            event = build(row, source, now_iso)
+            if event:
+                yield event
+    
+    @staticmethod
+    def _normalize_event(raw_event: Dict, source: str = "", default_timestamp: Optional[str] = None) -> Optional[Dict]:
         """
         Normalize event data to standard format.
         Handles various field names and formats.
@@ -201,44 +560,40 @@ class DataLoader:
         Args:
             raw_event: Raw event dictionary
             source: Source identifier
+            default_timestamp: ISO timestamp for events without one
+                (batch loaders pass one value for the whole load)
         
         Returns:
             Normalized event dictionary or None if invalid
         """
-        from config import RISK_RULES, USERS
-        
         # Extract user_id (handle various field names)
-        user_id = (
-            raw_event.get('user_id') or 
-            raw_event.get('user') or 
-            raw_event.get('username') or
-            raw_event.get('userId')
-        )
+        for key in _USER_KEYS:
+            user_id = raw_event.get(key)
+            if user_id:
+                break
         
-        # Extract activity (handle various field names)
-        activity = (
-            raw_event.get('activity') or 
-            raw_event.get('action') or 
-            raw_event.get('event_type') or
-            raw_event.get('type')
-        )
-        
-        # Validate required fields
-        if not user_id or not activity:
+        # Validate user exists (non-string IDs such as numbers or lists never match)
+        if not isinstance(user_id, str) or user_id not in _USER_SET:
             return None
         
-        # Validate user exists
-        if user_id not in USERS:
-            return None
+        # Extract activity (handle various field names)
+        for key in _ACTIVITY_KEYS:
+            activity = raw_event.get(key)
+            if activity:
+                break
         
         # Validate activity exists in RISK_RULES
-        if activity not in RISK_RULES:
+        if not isinstance(activity, str) or activity not in _ACTIVITY_SET:
             return None
         
         # Extract timestamp (handle various formats)
-        timestamp = raw_event.get('timestamp') or raw_event.get('time') or raw_event.get('date')
+        for key in _TIMESTAMP_KEYS:
+            timestamp = raw_event.get(key)
+            if timestamp:
+                break
+        
         if not timestamp:
-            timestamp = datetime.now().isoformat()
+            timestamp = default_timestamp or datetime.now().isoformat()
         elif isinstance(timestamp, datetime):
             timestamp = timestamp.isoformat()
         
@@ -247,12 +602,16 @@ class DataLoader:
             'timestamp': timestamp,
             'user_id': user_id,
             'activity': activity,
-            'source': source or raw_event.get('source', 'unknown')
+            'source': source or raw_event.get('source', 'unknown'),
+            'risk_increase': RISK_RULES[activity]
         }
         
+        # Explicit risk overrides the rule-based value (blank CSV cells keep the default)
+        risk_increase = raw_event.get('risk_increase')
+        if risk_increase is not None and risk_increase != '':
+            normalized['risk_increase'] = int(risk_increase)
+        
         # Add optional enhanced fields
-        if 'risk_increase' in raw_event:
-            normalized['risk_increase'] = int(raw_event['risk_increase'])
         
         if 'details' in raw_event:
             normalized['details'] = str(raw_event['details'])
@@ -267,27 +626,31 @@ class DataLoader:
             normalized['url'] = raw_event.get('url')
         
         # Copy any other fields that might be useful
-        for key in ['severity', 'category', 'description', 'metadata']:
+        for key in _EXTRA_KEYS:
             if key in raw_event:
                 normalized[key] = raw_event[key]
         
         return normalized
     
     @staticmethod
-    def create_sample_csv_file(file_path: str, num_events: int = 50):
+    def create_sample_csv_file(file_path: str, num_events: int = 50, seed: Optional[int] = None):
         """
         Create a sample CSV file for testing.
         
         Args:
             file_path: Path where to create the file
             num_events: Number of sample events to generate
+            seed: Optional random seed for reproducible samples
         """
-        from config import USERS, RISK_RULES
-        import random
-        
         activities = list(RISK_RULES.keys())
         users = list(USERS.keys())
         
+        # Draw every random column in one vectorized call each
+        rng = np.random.default_rng(seed)
+        user_idx = rng.integers(0, len(users), num_events).tolist()
+        activity_idx = rng.integers(0, len(activities), num_events).tolist()
+        ip_octets = rng.integers(1, 256, num_events).tolist()
+        
         with open(file_path, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=[
                 'timestamp', 'user_id', 'activity', 'risk_increase', 
@@ -295,10 +658,10 @@ class DataLoader:
             ])
             writer.writeheader()
             
+            timestamp = datetime.now().isoformat()
             for i in range(num_events):
-                timestamp = datetime.now().isoformat()
-                user = random.choice(users)
-                activity = random.choice(activities)
+                user = users[user_idx[i]]
+                activity = activities[activity_idx[i]]
                 risk = RISK_RULES[activity]
                 
                 writer.writerow({
@@ -307,30 +670,34 @@ class DataLoader:
                     'activity': activity,
                     'risk_increase': risk,
                     'details': f'Sample event {i+1}',
-                    'ip_address': f'192.168.1.{random.randint(1, 255)}',
+                    'ip_address': f'192.168.1.{ip_octets[i]}',
                     'file_path': f'/data/file_{i}.txt' if activity in ['file_download', 'data_copy_to_usb'] else ''
                 })
     
     @staticmethod
-    def create_sample_json_file(file_path: str, num_events: int = 50):
+    def create_sample_json_file(file_path: str, num_events: int = 50, seed: Optional[int] = None):
         """
         Create a sample JSON file for testing.
         
         Args:
             file_path: Path where to create the file
             num_events: Number of sample events to generate
+            seed: Optional random seed for reproducible samples
         """
-        from config import USERS, RISK_RULES
-        import random
-        
         activities = list(RISK_RULES.keys())
         users = list(USERS.keys())
         
+        # Draw every random column in one vectorized call each
+        rng = np.random.default_rng(seed)
+        user_idx = rng.integers(0, len(users), num_events).tolist()
+        activity_idx = rng.integers(0, len(activities), num_events).tolist()
+        ip_octets = rng.integers(1, 256, num_events).tolist()
+        
+        timestamp = datetime.now().isoformat()
         events = []
         for i in range(num_events):
-            timestamp = datetime.now().isoformat()
-            user = random.choice(users)
-            activity = random.choice(activities)
+            user = users[user_idx[i]]
+            activity = activities[activity_idx[i]]
             risk = RISK_RULES[activity]
             
             event = {
@@ -339,7 +706,7 @@ class DataLoader:
                 'activity': activity,
                 'risk_increase': risk,
                 'details': f'Sample event {i+1}',
-                'ip_address': f'192.168.1.{random.randint(1, 255)}',
+                'ip_address': f'192.168.1.{ip_octets[i]}',
             }
             
             if activity in ['file_download', 'data_copy_to_usb']:
@@ -347,5 +714,9 @@ class DataLoader:
             
             events.append(event)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(events, f, indent=2)
+        if orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(events, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(events, f, indent=2)
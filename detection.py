@@ -2,33 +2,192 @@
 Detection Module
 ================
 This module contains all detection-related functions including:
-- AI anomaly detection using Isolation Forest
+- AI anomaly detection using a robust z-score model or Isolation Forest
 - Sentiment analysis using TextBlob
 - Risk scoring and gamification functions
 """
 
 import random
+import threading
+import time
 import numpy as np
-from datetime import datetime
-from sklearn.ensemble import IsolationForest
-from textblob import TextBlob
 
+from user_state import RiskScores, STATUS_ACTIVE_CODE
 from config import (
+    AI_DETECTION_METHOD, AI_MAX_HISTORY,
     AI_CONTAMINATION, AI_MIN_SAMPLES, AI_ANOMALY_RISK_PENALTY, AI_RETRAIN_INTERVAL,
     NEGATIVE_SENTIMENT_THRESHOLD, NEGATIVE_SENTIMENT_RISK_PENALTY, SENTIMENT_ANALYSIS_PROBABILITY,
     SIMULATED_MESSAGES, SECURITY_POINTS_NORMAL_ACTIVITY, SECURITY_POINTS_LOW_RISK_ACTIVITY,
-    SECURITY_POINTS_PER_DECAY_CYCLE, RISK_LOW, USERS
+    SECURITY_POINTS_PER_DECAY_CYCLE, RISK_LOW, USERS, USER_STATUS_ACTIVE
 )
 
 
+# scikit-learn and TextBlob are slow to import, so they are imported on first
+# use (Isolation Forest training, sentiment table build) rather than at startup
+
+
+# Log timestamps have one-second resolution, so the formatted string is
+# cached and only rebuilt when the second changes
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+_timestamp_second = None
+_timestamp_text = ""
+
+
+def current_timestamp():
+    """
+    Get the current local time formatted for the activity/incident logs.
+    
+    Returns:
+        Timestamp string in TIMESTAMP_FORMAT
+    """
+    global _timestamp_second, _timestamp_text
+    second = int(time.time())
+    if second != _timestamp_second:
+        _timestamp_text = time.strftime(TIMESTAMP_FORMAT, time.localtime(second))
+        _timestamp_second = second
+    return _timestamp_text
+
+
+def _compute_polarity(message):
+    """Run TextBlob on a message, returning a neutral score if NLTK data is unavailable."""
+    try:
+        from textblob import TextBlob
+        return TextBlob(message).sentiment.polarity
+    except Exception:
+        return 0.0
+
+
+def _build_sentiment_row(message):
+    """
+    Precompute everything analyze_sentiment needs for one simulated message.
+    
+    Returns:
+        Tuple of (message, polarity, label, risk_increase, activity_description)
+    """
+    sentiment_score = _compute_polarity(message)
+    
+    if sentiment_score < NEGATIVE_SENTIMENT_THRESHOLD:
+        sentiment_label = "Negative"
+        risk_increase = NEGATIVE_SENTIMENT_RISK_PENALTY
+    elif sentiment_score > 0.1:
+        sentiment_label = "Positive"
+        risk_increase = 0
+    else:
+        sentiment_label = "Neutral"
+        risk_increase = 0
+    
+    display_message = message[:50] + "..." if len(message) > 50 else message
+    activity_description = f"Communication Sentiment: {sentiment_label} (Score: {sentiment_score:.2f}) - \"{display_message}\""
+    
+    return message, sentiment_score, sentiment_label, risk_increase, activity_description
+
+
+# SIMULATED_MESSAGES is fixed, so polarity, label, penalty and display text are
+# computed once (on first use) instead of re-running TextBlob on every tick
+_sentiment_table = None
+_sentiment_table_lock = threading.Lock()
+
+
+def _get_sentiment_table():
+    """Return the precomputed sentiment rows, building them on first call."""
+    global _sentiment_table
+    if _sentiment_table is None:
+        with _sentiment_table_lock:
+            if _sentiment_table is None:
+                _sentiment_table = tuple(_build_sentiment_row(message) for message in SIMULATED_MESSAGES)
+    return _sentiment_table
+
+
+def sentiment_table_ready():
+    """
+    Check whether the sentiment table has been built, so callers on the Tk
+    thread can skip sentiment analysis rather than wait for TextBlob.
+    
+    Returns:
+        True once analyze_sentiment can run without building the table
+    """
+    return _sentiment_table is not None
+
+
+class RobustZScoreModel:
+    """
+    Closed-form anomaly model on the user risk score feature.
+    Scores each sample by its modified z-score (Iglewicz & Hoaglin) against
+    the training median/MAD. The cutoff is the z-score exceeded by the
+    AI_CONTAMINATION share of the training samples, so it flags about as
+    many samples as IsolationForest does. Mirrors the sklearn fit/predict
+    interface so it can stand in for IsolationForest.
+    """
+    
+    def __init__(self, contamination=AI_CONTAMINATION):
+        self.contamination = contamination
+        self.median = 0.0
+        self.scale = 0.0
+        self.threshold = 0.0
+    
+    def fit(self, X):
+        """Fit median, spread and cutoff on the first (user risk) feature column."""
+        risk = np.asarray(X, dtype=np.float64)[:, 0]
+        self.median = float(np.median(risk))
+        deviations = np.abs(risk - self.median)
+        mad = float(np.median(deviations))
+        
+        if mad > 0:
+            self.scale = mad / 0.6745
+        else:
+            # More than half the samples sit on the median; fall back to mean absolute deviation
+            self.scale = float(deviations.mean()) * 1.253314
+        
+        if self.scale > 0:
+            self.threshold = float(np.quantile(deviations / self.scale, 1.0 - self.contamination))
+        return self
+    
+    def predict(self, X):
+        """Return -1 for anomalies and 1 for normal samples, like sklearn."""
+        deviations = np.abs(np.asarray(X, dtype=np.float64)[:, 0] - self.median)
+        if self.scale > 0:
+            is_anomaly = deviations > self.threshold * self.scale
+        else:
+            is_anomaly = deviations > 0
+        return np.where(is_anomaly, -1, 1)
+
+
 class AnomalyDetector:
-    """AI-based anomaly detection using Isolation Forest algorithm."""
+    """AI-based anomaly detection using a robust z-score model or Isolation Forest."""
+    
+    METHOD_LABELS = {
+        "robust_zscore": "Robust Z-Score",
+        "isolation_forest": "Isolation Forest",
+    }
     
-    def __init__(self):
+    def __init__(self, method=AI_DETECTION_METHOD, max_history=AI_MAX_HISTORY):
+        self.method = method
+        self.method_label = self.METHOD_LABELS.get(method, method)
         self.model = None
-        self.historical_data = []
+        # Ring buffer of [user_risk, avg_risk, max_risk] rows; oldest rows are overwritten
+        self._ring = np.empty((max_history, 3), dtype=np.float64)
+        self._ring_idx = 0  # Total rows ever written
+        # Reused feature buffer so predictions don't allocate a new array per call
+        self._scratch = np.empty((1, 3), dtype=np.float64)
         self.activities_since_training = 0
     
+    @staticmethod
+    def _risk_stats(risk_scores):
+        """Return (avg_risk, max_risk) for a risk score dictionary in a single pass each."""
+        if not risk_scores:
+            return 0.0, 0.0
+        if isinstance(risk_scores, RiskScores):
+            return risk_scores.average(), risk_scores.max_score
+        all_scores = risk_scores.values()
+        return sum(all_scores) / len(risk_scores), max(all_scores)
+    
+    @staticmethod
+    def _score_array(risk_scores):
+        """Return the risk scores as an array, in user order."""
+        if isinstance(risk_scores, RiskScores):
+            return risk_scores.array
+        return np.fromiter(risk_scores.values(), dtype=np.float64, count=len(risk_scores))
+    
     def collect_training_data(self, risk_scores):
         """
         Collect current risk score patterns for AI model training.
@@ -37,34 +196,83 @@ class AnomalyDetector:
         Args:
             risk_scores: Dictionary of user_id -> risk_score
         """
-        all_scores = list(risk_scores.values())
-        avg_risk = sum(all_scores) / len(all_scores) if all_scores else 0
-        max_risk = max(all_scores) if all_scores else 0
+        if not risk_scores:
+            return
+        
+        avg_risk, max_risk = self._risk_stats(risk_scores)
+        capacity = len(self._ring)
+        scores = self._score_array(risk_scores)[-capacity:]
+        count = len(scores)
+        start = self._ring_idx % capacity
+        first = min(count, capacity - start)
+        
+        # Write the tick's rows as one contiguous block, plus a second block
+        # only when they wrap past the end of the ring
+        stats = (avg_risk, max_risk)
+        head = self._ring[start:start + first]
+        head[:, 0] = scores[:first]
+        head[:, 1:] = stats
+        if first < count:
+            tail = self._ring[:count - first]
+            tail[:, 0] = scores[first:]
+            tail[:, 1:] = stats
         
-        for user_id, risk_score in risk_scores.items():
-            feature_vector = [risk_score, avg_risk, max_risk]
-            self.historical_data.append(feature_vector)
+        self._ring_idx += count
     
-    def train_model(self):
-        """Train the Isolation Forest model on historical risk score data."""
-        if len(self.historical_data) < AI_MIN_SAMPLES:
-            return
+    @property
+    def sample_count(self):
+        """Number of training samples currently held (capped at the ring size)."""
+        return min(self._ring_idx, len(self._ring))
+    
+    def training_snapshot(self):
+        """
+        Copy the current training samples so a model can be fitted on them
+        while new samples keep arriving.
         
+        Returns:
+            (n_samples, 3) array, or None if there are too few samples to train
+        """
+        if self.sample_count < AI_MIN_SAMPLES:
+            return None
+        return self._ring[:self.sample_count].copy()
+    
+    def fit_model(self, training_data):
+        """
+        Build and fit a new model of the configured type. Does not modify the
+        detector, so it can run on a worker thread.
+        
+        Args:
+            training_data: Array from training_snapshot
+            
+        Returns:
+            Fitted model, or None if training failed
+        """
         try:
-            training_data = np.array(self.historical_data)
-            self.model = IsolationForest(
-                contamination=AI_CONTAMINATION,
-                random_state=42,
-                n_estimators=100
-            )
-            self.model.fit(training_data)
+            if self.method == "isolation_forest":
+                from sklearn.ensemble import IsolationForest
+                model = IsolationForest(
+                    contamination=AI_CONTAMINATION,
+                    random_state=42,
+                    n_estimators=100
+                )
+            else:
+                model = RobustZScoreModel()
+            model.fit(training_data)
+            return model
         except Exception as e:
             print(f"Model training error: {e}")
-            self.model = None
+            return None
+    
+    def train_model(self):
+        """Train the configured anomaly model on historical risk score data."""
+        training_data = self.training_snapshot()
+        if training_data is None:
+            return
+        self.model = self.fit_model(training_data)
     
     def detect_anomaly(self, user_id, risk_scores):
         """
-        Use Isolation Forest to detect anomalous user behavior.
+        Use the trained model to detect anomalous user behavior.
         
         Args:
             user_id: ID of the user to check
@@ -77,12 +285,12 @@ class AnomalyDetector:
             return False
         
         try:
-            all_scores = list(risk_scores.values())
-            avg_risk = sum(all_scores) / len(all_scores) if all_scores else 0
-            max_risk = max(all_scores) if all_scores else 0
+            avg_risk, max_risk = self._risk_stats(risk_scores)
             
-            current_user_risk = risk_scores[user_id]
-            feature_vector = np.array([[current_user_risk, avg_risk, max_risk]])
+            feature_vector = self._scratch
+            feature_vector[0, 0] = risk_scores[user_id]
+            feature_vector[0, 1] = avg_risk
+            feature_vector[0, 2] = max_risk
             prediction = self.model.predict(feature_vector)
             
             return prediction[0] == -1
@@ -95,7 +303,7 @@ class SentimentAnalyzer:
     """Sentiment analysis for user communications using TextBlob."""
     
     @staticmethod
-    def analyze_sentiment(user_id, user_status, risk_scores, activity_table, total_activities):
+    def analyze_sentiment(user_id, user_status, risk_scores, log_activity, total_activities):
         """
         Analyze sentiment of a simulated user communication message.
         
@@ -103,48 +311,24 @@ class SentimentAnalyzer:
             user_id: ID of the user
             user_status: Current user status (ACTIVE/LOCKED)
             risk_scores: Dictionary of risk scores (will be modified)
-            activity_table: Activity log table to insert results
+            log_activity: Callable taking an activity log row, or None
             total_activities: Counter for total activities
             
         Returns:
             Tuple of (risk_increase, updated_total_activities)
         """
-        from config import USER_STATUS_ACTIVE
-        
         if user_status != USER_STATUS_ACTIVE:
             return 0, total_activities
         
-        message = random.choice(SIMULATED_MESSAGES)
-        
-        try:
-            blob = TextBlob(message)
-            sentiment_score = blob.sentiment.polarity
-        except Exception:
-            sentiment_score = 0.0
-        
-        if sentiment_score < NEGATIVE_SENTIMENT_THRESHOLD:
-            sentiment_label = "Negative"
-            is_negative = True
-        elif sentiment_score > 0.1:
-            sentiment_label = "Positive"
-            is_negative = False
-        else:
-            sentiment_label = "Neutral"
-            is_negative = False
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        risk_increase = 0
-        
-        if is_negative:
-            risk_increase = NEGATIVE_SENTIMENT_RISK_PENALTY
-            if user_id in risk_scores:
-                risk_scores[user_id] = max(0, risk_scores[user_id] + risk_increase)
+        table = _sentiment_table or _get_sentiment_table()
+        _, _, _, risk_increase, activity_description = table[random.randrange(len(table))]
+        timestamp = current_timestamp()
         
-        display_message = message[:50] + "..." if len(message) > 50 else message
-        activity_description = f"Communication Sentiment: {sentiment_label} (Score: {sentiment_score:.2f}) - \"{display_message}\""
+        if risk_increase and user_id in risk_scores:
+            risk_scores[user_id] = max(0, risk_scores[user_id] + risk_increase)
         
-        if activity_table:
-            activity_table.insert("", 0, values=(timestamp, user_id, activity_description, risk_increase))
+        if log_activity:
+            log_activity((timestamp, user_id, activity_description, risk_increase))
         
         return risk_increase, total_activities + 1
 
@@ -182,17 +366,25 @@ class SecurityPointsManager:
             user_status: Current user status
             security_points: Dictionary of security points (will be modified)
         """
-        from config import USER_STATUS_ACTIVE
-        
         if user_status == USER_STATUS_ACTIVE:
             security_points[user_id] += SECURITY_POINTS_PER_DECAY_CYCLE
+    
+    @staticmethod
+    def award_decay_points_bulk(status_codes, security_points):
+        """
+        Award decay points to every active user in one vectorized step.
+        
+        Args:
+            status_codes: UserStatuses.array of per-user status codes
+            security_points: Per-user security points array (will be modified)
+        """
+        security_points[status_codes == STATUS_ACTIVE_CODE] += SECURITY_POINTS_PER_DECAY_CYCLE
 
 
 def verify_textblob_setup():
-    """Verify that TextBlob and NLTK are properly configured."""
-    try:
-        test_blob = TextBlob("test")
-        _ = test_blob.sentiment.polarity
-    except Exception:
-        pass
+    """
+    Verify that TextBlob and NLTK are properly configured, and warm the
+    sentiment table. Safe to run on a background thread; it touches no Tk state.
+    """
+    _get_sentiment_table()
 
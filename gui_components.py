@@ -6,12 +6,102 @@ This module contains functions for building GUI components including:
 - Buttons and controls
 - Progress bars
 - Statistics panels
+- Treeview batch update helpers
+- Coalesced UI update dispatcher
+- Lazily built log tables
 """
 
+import math
+import time
 import tkinter as tk
+from collections import deque
+from contextlib import contextmanager
 from tkinter import ttk
-from config import USERS, RISK_THRESHOLD
-from gui_styles import configure_progress_bar_styles, configure_table_tags, COLORS, FONTS
+from config import USERS, RISK_THRESHOLD, MAX_INCIDENT_ROWS, LOG_HISTORY_LIMIT
+from gui_styles import configure_theme, configure_table_tags, COLORS, FONTS
+
+# Risk bar Canvas layout (pixels)
+PROGRESS_ROW_HEIGHT = 22
+_BAR_X0 = 110
+_BAR_LENGTH = 400
+_BAR_HEIGHT = 14
+
+# Tcl procedure that redraws a whole risk bar row (bar geometry and colour,
+# risk text, status text) so a restyle costs one Python->Tcl call, not four
+_RISK_ROW_PROC = "itm_update_risk_row"
+_RISK_ROW_PROC_SOURCE = """
+proc itm_update_risk_row {canvas bar risk status x0 y0 x1 y1 bar_color risk_text risk_color status_text status_color} {
+    $canvas coords $bar $x0 $y0 $x1 $y1
+    $canvas itemconfigure $bar -fill $bar_color
+    $canvas itemconfigure $risk -text $risk_text -fill $risk_color
+    $canvas itemconfigure $status -text $status_text -fill $status_color
+}
+"""
+
+# Control button labels, shared with the app so toggled labels stay in sync
+START_LABEL = "▶ Start Monitoring"
+STOP_LABEL = "⏹ Stop Monitoring"
+RESET_LABEL = "🔄 Reset All Risk Scores"
+PAUSE_LABEL = "⏸ Pause"
+RESUME_LABEL = "▶ Resume"
+EXPORT_ACTIVITY_LABEL = "📥 Export Activity Log"
+EXPORT_INCIDENTS_LABEL = "📥 Export Incidents"
+
+# Fixed Treeview column widths (pixels); fixed, non-stretching columns keep
+# Tk from re-measuring cell text on every insert
+USER_COLUMN_WIDTH = 120
+ACTIVITY_COLUMN_WIDTHS = {"Time": 150, "User": 90, "Activity": 420, "Risk Increase": 110}
+INCIDENT_COLUMN_WIDTHS = {"Time": 150, "User": 90, "Risk Score": 100, "Message": 480}
+
+
+class RiskBarPanel:
+    """
+    Canvas item ids and last-drawn state for every user's risk bar, stored as
+    parallel lists indexed by row (user order in USERS). index maps user_id
+    to that row number.
+    """
+    
+    __slots__ = (
+        'canvas', 'tk_call', 'canvas_path', 'index',
+        'bars', 'bar_boxes', 'risk_texts', 'status_texts', 'last_values', 'last_styles'
+    )
+    
+    def __init__(self, canvas):
+        """
+        Args:
+            canvas: Shared progress Canvas
+        """
+        self.canvas = canvas
+        # Raw interpreter call and widget path, cached so updates skip
+        # tkinter's method dispatch and option marshalling
+        self.tk_call = canvas.tk.call
+        self.canvas_path = str(canvas)
+        self.index = {}
+        self.bars = []
+        self.bar_boxes = []
+        self.risk_texts = []
+        self.status_texts = []
+        self.last_values = []
+        self.last_styles = []
+    
+    def add_row(self, user_id, bar, bar_box, risk_text, status_text):
+        """
+        Register one user's row.
+        
+        Args:
+            user_id: User the row belongs to
+            bar: Item id of the bar rectangle
+            bar_box: (x0, y0, y1) of the bar; x1 follows the value
+            risk_text: Item id of the risk score text
+            status_text: Item id of the status indicator text
+        """
+        self.index[user_id] = len(self.bars)
+        self.bars.append(bar)
+        self.bar_boxes.append(bar_box)
+        self.risk_texts.append(risk_text)
+        self.status_texts.append(status_text)
+        self.last_values.append(0)
+        self.last_styles.append(None)
 
 
 def build_user_table(parent):
@@ -22,10 +112,12 @@ def build_user_table(parent):
         parent: Parent widget (root window)
         
     Returns:
-        Tuple of (user_table, progress_bars_frame, user_progress_bars_dict)
+        Tuple of (user_table, progress_canvas, risk_bars), where risk_bars is
+        the RiskBarPanel holding every user's bar
     """
     table_frame = tk.Frame(parent, bg=COLORS['bg_panel'])
     table_frame.pack(fill="x", padx=20, pady=15)
+    table_frame.grid_columnconfigure(0, weight=1)
 
     tk.Label(
         table_frame,
@@ -33,75 +125,356 @@ def build_user_table(parent):
         bg=COLORS['bg_panel'],
         fg=COLORS['fg_white'],
         font=FONTS['heading']
-    ).pack(anchor="w", padx=10, pady=5)
+    ).grid(row=0, column=0, sticky="w", padx=10, pady=5)
 
     table_columns = ("User ID", "Role", "Risk Score", "Status", "Security Score")
     user_table = ttk.Treeview(table_frame, columns=table_columns, show="headings", height=5)
 
     for column in table_columns:
         user_table.heading(column, text=column)
-        user_table.column(column, anchor="center")
+        user_table.column(column, anchor="center", width=USER_COLUMN_WIDTH, minwidth=60, stretch=False)
+    user_table.configure(displaycolumns=table_columns)
     
-    configure_progress_bar_styles()
-    user_table.pack(fill="x", padx=10, pady=5)
+    configure_theme()
+    user_table.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
     configure_table_tags(user_table)
     
-    progress_bars_frame = tk.Frame(table_frame, bg=COLORS['bg_panel'])
-    progress_bars_frame.pack(fill="x", padx=10, pady=5)
+    # All per-user risk bars live on one Canvas: one window and one redraw,
+    # updated through item coords/itemconfigure instead of per-user widgets
+    progress_canvas = tk.Canvas(
+        table_frame,
+        height=PROGRESS_ROW_HEIGHT * len(USERS),
+        bg=COLORS['bg_panel'],
+        highlightthickness=0
+    )
+    progress_canvas.grid(row=2, column=0, sticky="ew", padx=10, pady=5)
+    progress_canvas.tk.eval(_RISK_ROW_PROC_SOURCE)
     
-    user_progress_bars = {}
+    risk_bars = RiskBarPanel(progress_canvas)
+    bar_x0 = _BAR_X0
+    bar_x1 = _BAR_X0 + _BAR_LENGTH
     
-    for user_id in USERS.keys():
-        user_progress_frame = tk.Frame(progress_bars_frame, bg=COLORS['bg_panel'])
-        user_progress_frame.pack(fill="x", pady=2)
+    for row_index, user_id in enumerate(USERS.keys()):
+        row_top = row_index * PROGRESS_ROW_HEIGHT
+        row_middle = row_top + PROGRESS_ROW_HEIGHT // 2
+        bar_y0 = row_middle - _BAR_HEIGHT // 2
+        bar_y1 = bar_y0 + _BAR_HEIGHT
         
-        user_label = tk.Label(
-            user_progress_frame,
+        progress_canvas.create_text(
+            5, row_middle,
             text=f"{user_id}:",
-            bg=COLORS['bg_panel'],
-            fg=COLORS['fg_white'],
+            fill=COLORS['fg_white'],
             font=FONTS['tiny'],
-            width=12,
             anchor="w"
         )
-        user_label.pack(side="left", padx=5)
-        
-        progress_bar = ttk.Progressbar(
-            user_progress_frame,
-            length=200,
-            mode='determinate',
-            maximum=RISK_THRESHOLD
+        progress_canvas.create_rectangle(
+            bar_x0, bar_y0, bar_x1, bar_y1,
+            fill=COLORS['bar_trough'],
+            outline=""
         )
-        progress_bar.pack(side="left", padx=5, fill="x", expand=True)
-        
-        risk_label = tk.Label(
-            user_progress_frame,
+        bar_item = progress_canvas.create_rectangle(
+            bar_x0, bar_y0, bar_x0, bar_y1,
+            fill=COLORS['bar_green'],
+            outline=""
+        )
+        risk_item = progress_canvas.create_text(
+            bar_x1 + 45, row_middle,
             text="0",
-            bg=COLORS['bg_panel'],
-            fg=COLORS['fg_white'],
+            fill=COLORS['fg_white'],
             font=FONTS['small_bold'],
-            width=5,
             anchor="e"
         )
-        risk_label.pack(side="left", padx=5)
-        
-        status_indicator = tk.Label(
-            user_progress_frame,
+        status_item = progress_canvas.create_text(
+            bar_x1 + 55, row_middle,
             text="",
-            bg=COLORS['bg_panel'],
-            fg=COLORS['fg_locked'],
+            fill=COLORS['fg_locked'],
             font=FONTS['small_bold'],
-            width=8
+            anchor="w"
         )
-        status_indicator.pack(side="left", padx=5)
         
-        user_progress_bars[user_id] = {
-            'progress_bar': progress_bar,
-            'risk_label': risk_label,
-            'status_indicator': status_indicator
-        }
+        risk_bars.add_row(user_id, bar_item, (bar_x0, bar_y0, bar_y1), risk_item, status_item)
+    
+    # Once the pending layout pass has sized the panel from its children, pin
+    # that height so later row and text updates stop propagating resize
+    # requests up to the root. Queued rather than forced with update_idletasks
+    # so startup still lays out the window in a single pass.
+    table_frame.after_idle(_pin_panel_height, table_frame)
+    
+    return user_table, progress_canvas, risk_bars
+
+
+def _pin_panel_height(frame):
+    """Fix a grid container at its current requested height."""
+    frame.configure(height=frame.winfo_reqheight())
+    frame.grid_propagate(False)
+
+
+def set_progress(bars, row, value):
+    """
+    Set a user's risk bar value, skipping the Tcl call when it hasn't changed.
+    
+    Args:
+        bars: RiskBarPanel from build_user_table
+        row: Row number of the user (bars.index[user_id])
+        value: Bar value between 0 and RISK_THRESHOLD
+    """
+    if bars.last_values[row] == value:
+        return
+    bars.last_values[row] = value
+    
+    x0, y0, y1 = bars.bar_boxes[row]
+    bars.tk_call(bars.canvas_path, 'coords', bars.bars[row], x0, y0, x0 + _BAR_LENGTH * value / RISK_THRESHOLD, y1)
+
+
+def update_progress_row(bars, row, value, bar_color, risk_text, risk_color, status_text, status_color):
+    """
+    Redraw one user's risk bar row on the shared progress Canvas.
+    Only sends changes: unchanged values and styling cost no Tcl calls.
+    
+    Args:
+        bars: RiskBarPanel from build_user_table
+        row: Row number of the user (bars.index[user_id])
+        value: Bar value between 0 and RISK_THRESHOLD
+        bar_color: Fill color of the bar
+        risk_text, risk_color: Risk score text and its color
+        status_text, status_color: Status indicator text and its color
+    """
+    style = (bar_color, risk_text, risk_color, status_text, status_color)
+    if bars.last_styles[row] == style:
+        set_progress(bars, row, value)
+        return
+    bars.last_styles[row] = style
+    bars.last_values[row] = value
+    
+    x0, y0, y1 = bars.bar_boxes[row]
+    bars.tk_call(
+        _RISK_ROW_PROC, bars.canvas_path, bars.bars[row], bars.risk_texts[row], bars.status_texts[row],
+        x0, y0, x0 + _BAR_LENGTH * value / RISK_THRESHOLD, y1,
+        bar_color, risk_text, risk_color, status_text, status_color
+    )
+
+
+class UIUpdateBatcher:
+    """
+    Coalesces widget updates and applies them in one deferred pass.
+    Updates are keyed, so repeated updates to the same widget between flushes
+    collapse into the latest one, and flushes run at most max_rate times per
+    second regardless of how fast the simulation produces updates.
+    """
+    
+    def __init__(self, root, max_rate=20):
+        """
+        Args:
+            root: Tk root used to schedule flushes
+            max_rate: Maximum number of flushes per second
+        """
+        self.root = root
+        self.min_interval = 1.0 / max_rate
+        self.pending = {}
+        self.scheduled = False
+        self.last_flush = 0.0
+    
+    def update(self, key, fn, *args):
+        """
+        Queue fn(*args), replacing any pending update with the same key.
+        
+        Args:
+            key: Hashable identifier for the widget/update being queued
+            fn: Callable that performs the update
+            *args: Arguments passed to fn on flush
+        """
+        self.pending[key] = (fn, args)
+        if self.scheduled:
+            return
+        
+        self.scheduled = True
+        delay = self.last_flush + self.min_interval - time.monotonic()
+        if delay > 0:
+            self.root.after(int(delay * 1000), self.flush)
+        else:
+            self.root.after_idle(self.flush)
+    
+    def flush(self):
+        """Apply every pending update now."""
+        self.scheduled = False
+        self.last_flush = time.monotonic()
+        pending, self.pending = self.pending, {}
+        for fn, args in pending.values():
+            fn(*args)
+
+
+class PeriodicScheduler:
+    """
+    Runs every periodic task from a single Tk timer. Each task keeps its own
+    interval and next deadline, and the timer is armed for the earliest one,
+    so there is no fixed-rate polling. Registering a task under a key that
+    is already scheduled replaces it instead of starting a second chain.
+    """
+    
+    def __init__(self, root):
+        """
+        Args:
+            root: Tk root used to schedule the timer
+        """
+        self.root = root
+        self.tasks = {}  # key -> [next_deadline, interval_seconds, fn]
+        self.timer = None
+    
+    def every(self, key, interval_ms, fn):
+        """
+        Run fn() every interval_ms milliseconds, first after one interval.
+        
+        Args:
+            key: Hashable task name; an existing task with this key is replaced
+            interval_ms: Milliseconds between runs
+            fn: Callable taking no arguments
+        """
+        interval = interval_ms / 1000
+        self.tasks[key] = [time.monotonic() + interval, interval, fn]
+        self._arm()
+    
+    def cancel(self, key):
+        """Stop a task; unknown keys are ignored."""
+        if self.tasks.pop(key, None) is not None:
+            self._arm()
+    
+    def _arm(self):
+        """Point the Tk timer at the earliest deadline."""
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        if self.tasks:
+            deadline = min(task[0] for task in self.tasks.values())
+            delay_ms = max(0, math.ceil((deadline - time.monotonic()) * 1000))
+            self.timer = self.root.after(delay_ms, self._run)
+    
+    def _run(self):
+        """Run every task whose deadline has passed, then re-arm the timer."""
+        self.timer = None
+        now = time.monotonic()
+        try:
+            for key, task in list(self.tasks.items()):
+                # A task run earlier in this pass may have cancelled or replaced this one
+                if task[0] <= now and self.tasks.get(key) is task:
+                    task[0] = now + task[1]
+                    task[2]()
+        finally:
+            self._arm()
+
+
+class LogHistory(deque):
+    """
+    Bounded deque of (item_id, row) pairs behind a log table. dropped counts
+    the rows evicted since the last clear, so an export can tell whether the
+    history still holds every row.
+    """
+    
+    def __init__(self, maxlen):
+        super().__init__(maxlen=maxlen)
+        self.dropped = 0
+
+
+class LazyLogTable:
+    """
+    Stand-in for a log Treeview that is not created until first shown.
+    Until then, append_row and clear_log only touch the history deque; once
+    built, the newest rows from the history are loaded into the table and
+    every other attribute is forwarded to the real Treeview.
+    """
+    
+    def __init__(self, factory, log, cap):
+        """
+        Args:
+            factory: Callable that creates and lays out the Treeview
+            log: History deque shared with append_row
+            cap: Maximum number of rows shown in the table
+        """
+        self.factory = factory
+        self.log = log
+        self.cap = cap
+        self.tree = None
+    
+    def ensure(self):
+        """Create the Treeview if needed and return it."""
+        if self.tree is None:
+            self.tree = self.factory()
+            # Oldest visible row first, each inserted on top, so newest ends up first
+            for index in range(max(0, len(self.log) - self.cap), len(self.log)):
+                row = self.log[index][1]
+                self.log[index] = (self.tree.insert("", 0, values=row), row)
+        return self.tree
+    
+    def insert(self, parent, index, **kwargs):
+        if self.tree is None:
+            return None
+        return self.tree.insert(parent, index, **kwargs)
+    
+    def delete(self, *items):
+        if self.tree is not None:
+            self.tree.delete(*items)
+    
+    def get_children(self, item=None):
+        if self.tree is None:
+            return ()
+        return self.tree.get_children(item)
     
-    return user_table, progress_bars_frame, user_progress_bars
+    def __getattr__(self, name):
+        return getattr(self.ensure(), name)
+
+
+@contextmanager
+def defer_redraw(root):
+    """
+    Build or rebuild a batch of widgets with input held and no intermediate
+    redraws, then lay out and draw the window in one idle pass on exit.
+    
+    Args:
+        root: Tk root window
+    """
+    try:
+        root.tk.call('tk', 'busy', 'hold', root)
+        busy = True
+    except tk.TclError:
+        # tk busy needs Tk 8.6; without it just skip the input hold
+        busy = False
+    
+    try:
+        yield root
+    finally:
+        if busy:
+            root.tk.call('tk', 'busy', 'forget', root)
+        root.update_idletasks()
+
+
+def batch_update(tree, rows, rendered):
+    """
+    Bring a keyed Treeview up to date in place. Rows are created the first
+    time their id is seen and afterwards only re-configured when their values
+    or tags differ from what was last rendered, so an unchanged row costs no
+    Tcl call. A row where only one cell changed is updated with a single
+    tree.set() instead of re-sending every value.
+    
+    Args:
+        tree: ttk.Treeview to update
+        rows: Iterable of (item_id, values, tags) tuples; new ids are appended in order
+        rendered: Dict of item_id -> (values, tags) last sent to the tree,
+            owned by the caller and updated here
+    """
+    for item_id, values, tags in rows:
+        row = (values, tags)
+        last = rendered.get(item_id)
+        if last == row:
+            continue
+        if last is None:
+            tree.insert("", "end", iid=item_id, values=values, tags=tags)
+        else:
+            last_values, last_tags = last
+            changed = [column for column, value in enumerate(values) if value != last_values[column]]
+            if tags == last_tags and len(changed) == 1:
+                tree.set(item_id, changed[0], values[changed[0]])
+            else:
+                tree.item(item_id, values=values, tags=tags)
+        rendered[item_id] = row
 
 
 def build_logs(parent):
@@ -112,7 +485,8 @@ def build_logs(parent):
         parent: Parent widget (root window)
         
     Returns:
-        Tuple of (activity_table, incident_table)
+        Tuple of (activity_table, activity_log, incident_table, incident_log),
+        where each log is a LogHistory fed by append_row
     """
     log_frame = tk.Frame(parent, bg=COLORS['bg_panel'])
     log_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -128,23 +502,73 @@ def build_logs(parent):
 
     for column in activity_columns:
         activity_table.heading(column, text=column)
-        activity_table.column(column, anchor="center")
+        activity_table.column(column, anchor="center", width=ACTIVITY_COLUMN_WIDTHS[column], minwidth=60, stretch=False)
+    activity_table.configure(displaycolumns=activity_columns)
 
     activity_table.pack(fill="both", expand=True)
 
     incident_tab = ttk.Frame(notebook)
     notebook.add(incident_tab, text="Incident Alerts")
 
-    incident_columns = ("Time", "User", "Risk Score", "Message")
-    incident_table = ttk.Treeview(incident_tab, columns=incident_columns, show="headings")
+    def build_incident_table():
+        incident_columns = ("Time", "User", "Risk Score", "Message")
+        incident_table = ttk.Treeview(incident_tab, columns=incident_columns, show="headings")
+
+        for column in incident_columns:
+            incident_table.heading(column, text=column)
+            incident_table.column(column, anchor="center", width=INCIDENT_COLUMN_WIDTHS[column], minwidth=60, stretch=False)
+        incident_table.configure(displaycolumns=incident_columns)
+
+        incident_table.pack(fill="both", expand=True)
+        return incident_table
+    
+    activity_log = LogHistory(LOG_HISTORY_LIMIT)
+    incident_log = LogHistory(LOG_HISTORY_LIMIT)
+    
+    # The incident Treeview is only created the first time its tab is shown
+    incident_table = LazyLogTable(build_incident_table, incident_log, MAX_INCIDENT_ROWS)
+    
+    def on_tab_changed(event):
+        if notebook.select() == str(incident_tab):
+            incident_table.ensure()
+    
+    notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+    
+    return activity_table, activity_log, incident_table, incident_log
+
+
+def append_row(tree, log, row, cap):
+    """
+    Add a row to the top of a log table, keeping at most cap rows in the widget.
+    The row is also recorded in log, so older rows stay available for export
+    after they scroll out of the table.
+    
+    Args:
+        tree: Log Treeview (newest row first)
+        log: LogHistory returned by build_logs
+        row: Tuple of column values
+        cap: Maximum number of rows shown in the table
+    """
+    item_id = tree.insert("", 0, values=row)
+    if len(log) == log.maxlen:
+        log.dropped += 1  # The append below evicts the oldest row
+    log.append((item_id, row))
+    if len(log) > cap:
+        # The row that just dropped below the cap is cap entries back
+        tree.delete(log[-cap - 1][0])
 
-    for column in incident_columns:
-        incident_table.heading(column, text=column)
-        incident_table.column(column, anchor="center")
 
-    incident_table.pack(fill="both", expand=True)
+def clear_log(tree, log):
+    """
+    Remove every row from a log table and its history.
     
-    return activity_table, incident_table
+    Args:
+        tree: Log Treeview
+        log: LogHistory returned by build_logs
+    """
+    tree.delete(*tree.get_children())
+    log.clear()
+    log.dropped = 0
 
 
 def build_statistics(parent):
@@ -155,7 +579,8 @@ def build_statistics(parent):
         parent: Parent widget (root window)
         
     Returns:
-        Tuple of (total_activities_label, avg_risk_label, max_risk_label)
+        Tuple of StringVars bound to the (total activities, average risk,
+        highest risk) labels; set() them to update the text
     """
     stats_frame = tk.Frame(parent, bg=COLORS['bg_panel'])
     stats_frame.pack(fill="x", padx=20, pady=10)
@@ -171,34 +596,44 @@ def build_statistics(parent):
     stats_content_frame = tk.Frame(stats_frame, bg=COLORS['bg_panel'])
     stats_content_frame.pack(fill="x", padx=10, pady=5)
     
-    total_activities_label = tk.Label(
-        stats_content_frame,
-        text="Total Activities: 0",
-        bg=COLORS['bg_panel'],
-        fg=COLORS['fg_stats'],
-        font=FONTS['small']
-    )
-    total_activities_label.pack(side="left", padx=20)
+    label_options = {'bg': COLORS['bg_panel'], 'fg': COLORS['fg_stats'], 'font': FONTS['small']}
+    stat_vars = []
+    for initial_text in ("Total Activities: 0", "Average Risk Score: 0.0", "Highest Risk Score: 0"):
+        stat_var = tk.StringVar(parent, value=initial_text)
+        tk.Label(stats_content_frame, textvariable=stat_var, **label_options).pack(side="left", padx=20)
+        stat_vars.append(stat_var)
     
-    avg_risk_label = tk.Label(
-        stats_content_frame,
-        text="Average Risk Score: 0.0",
-        bg=COLORS['bg_panel'],
-        fg=COLORS['fg_stats'],
-        font=FONTS['small']
-    )
-    avg_risk_label.pack(side="left", padx=20)
+    total_activities_var, avg_risk_var, max_risk_var = stat_vars
     
-    max_risk_label = tk.Label(
-        stats_content_frame,
-        text="Highest Risk Score: 0",
-        bg=COLORS['bg_panel'],
-        fg=COLORS['fg_stats'],
-        font=FONTS['small']
-    )
-    max_risk_label.pack(side="left", padx=20)
+    return total_activities_var, avg_risk_var, max_risk_var
+
+
+def make_button(parent, text, command, bg, **options):
+    """
+    Create and pack a flat control button in the app's button style.
     
-    return total_activities_label, avg_risk_label, max_risk_label
+    Args:
+        parent: Parent widget
+        text: Button label
+        command: Function to call when clicked
+        bg: Background color
+        **options: Overrides for the default tk.Button options
+        
+    Returns:
+        The packed tk.Button
+    """
+    button_options = {
+        'fg': COLORS['fg_white'],
+        'font': FONTS['button'],
+        'padx': 20,
+        'pady': 8,
+        'relief': "flat",
+        'cursor': "hand2",
+    }
+    button_options.update(options)
+    button = tk.Button(parent, text=text, command=command, bg=bg, **button_options)
+    button.pack(side="left", padx=5)
+    return button
 
 
 def build_monitoring_controls(parent, start_callback, stop_callback, reset_callback):
@@ -217,48 +652,15 @@ def build_monitoring_controls(parent, start_callback, stop_callback, reset_callb
     monitoring_frame = tk.Frame(parent, bg=COLORS['bg_dark'])
     monitoring_frame.pack(fill="x", padx=20, pady=10)
     
-    start_button = tk.Button(
-        monitoring_frame,
-        text="▶ Start Monitoring",
-        command=start_callback,
-        bg="#4a8a4a",
-        fg=COLORS['fg_white'],
-        font=FONTS['button'],
-        padx=20,
-        pady=8,
-        relief="flat",
-        cursor="hand2"
-    )
-    start_button.pack(side="left", padx=5)
-    
-    stop_button = tk.Button(
-        monitoring_frame,
-        text="⏹ Stop Monitoring",
-        command=stop_callback,
-        bg="#8a4a4a",
-        fg=COLORS['fg_white'],
-        font=FONTS['button'],
-        padx=20,
-        pady=8,
-        relief="flat",
-        cursor="hand2",
-        state="disabled"
-    )
-    stop_button.pack(side="left", padx=5)
-    
-    reset_button = tk.Button(
-        monitoring_frame,
-        text="🔄 Reset All Risk Scores",
-        command=reset_callback,
-        bg="#4a4a8a",
-        fg=COLORS['fg_white'],
-        font=FONTS['button'],
-        padx=20,
-        pady=8,
-        relief="flat",
-        cursor="hand2"
+    button_specs = (
+        (START_LABEL, start_callback, "#4a8a4a", {}),
+        (STOP_LABEL, stop_callback, "#8a4a4a", {'state': "disabled"}),
+        (RESET_LABEL, reset_callback, "#4a4a8a", {}),
     )
-    reset_button.pack(side="left", padx=5)
+    start_button, stop_button, reset_button = [
+        make_button(monitoring_frame, text, command, bg, **options)
+        for text, command, bg, options in button_specs
+    ]
     
     return start_button, stop_button
 
@@ -279,48 +681,16 @@ def build_controls(parent, pause_callback, export_activity_callback, export_inci
     control_frame = tk.Frame(parent, bg=COLORS['bg_dark'])
     control_frame.pack(fill="x", padx=20, pady=5)
     
-    pause_button = tk.Button(
-        control_frame,
-        text="⏸ Pause",
-        command=pause_callback,
-        bg="#4a4a4a",
-        fg=COLORS['fg_white'],
-        font=FONTS['label'],
-        padx=15,
-        pady=5,
-        relief="flat",
-        cursor="hand2",
-        state="disabled"
-    )
-    pause_button.pack(side="left", padx=5)
-    
-    export_activity_button = tk.Button(
-        control_frame,
-        text="📥 Export Activity Log",
-        command=export_activity_callback,
-        bg="#4a4a4a",
-        fg=COLORS['fg_white'],
-        font=FONTS['label'],
-        padx=15,
-        pady=5,
-        relief="flat",
-        cursor="hand2"
-    )
-    export_activity_button.pack(side="left", padx=5)
-    
-    export_incident_button = tk.Button(
-        control_frame,
-        text="📥 Export Incidents",
-        command=export_incident_callback,
-        bg="#4a4a4a",
-        fg=COLORS['fg_white'],
-        font=FONTS['label'],
-        padx=15,
-        pady=5,
-        relief="flat",
-        cursor="hand2"
+    small_button = {'font': FONTS['label'], 'padx': 15, 'pady': 5}
+    button_specs = (
+        (PAUSE_LABEL, pause_callback, {'state': "disabled"}),
+        (EXPORT_ACTIVITY_LABEL, export_activity_callback, {}),
+        (EXPORT_INCIDENTS_LABEL, export_incident_callback, {}),
     )
-    export_incident_button.pack(side="left", padx=5)
+    pause_button, export_activity_button, export_incident_button = [
+        make_button(control_frame, text, command, "#4a4a4a", **small_button, **options)
+        for text, command, options in button_specs
+    ]
     
     return pause_button
 
@@ -2,44 +2,70 @@
 GUI Styles Module
 =================
 This module contains all styling configurations for the GUI components.
-It includes color schemes, progress bar styles, and theme settings.
+It includes color schemes, fonts, risk band tags, and theme settings.
 """
 
+import tkinter.font as tkfont
 import tkinter.ttk as ttk
+from types import MappingProxyType
+from weakref import WeakSet
+import numpy as np
+from config import RISK_LOW, RISK_MEDIUM
 
+# Styles and tags only need configuring once; these guards skip repeat Tcl round-trips
+_theme_configured = False
+_tagged_tables = WeakSet()
 
-def configure_progress_bar_styles():
-    """
-    Configure progress bar styles for different risk levels.
-    Creates custom styles for green (low risk), yellow (medium risk),
-    and red (high risk) progress bars.
+# Shared ttk.Style instance, created on first use
+_style = None
+
+
+def get_style():
     """
-    style = ttk.Style()
-    style.theme_use('clam')
+    Get the shared ttk.Style instance, creating it on first call.
     
-    # Green progress bar for low risk
-    style.configure('green.Horizontal.TProgressbar',
-                   background='#4a8a4a',
-                   troughcolor='#1a1a1a',
-                   borderwidth=0,
-                   lightcolor='#6aaa6a',
-                   darkcolor='#4a8a4a')
+    Returns:
+        ttk.Style object
+    """
+    global _style
+    if _style is None:
+        _style = ttk.Style()
+    return _style
+
+
+def configure_theme():
+    """
+    Select the 'clam' ttk theme used by the tables and notebook.
+    Runs once per process; later calls return immediately.
+    """
+    global _theme_configured
+    if _theme_configured:
+        return
+    _theme_configured = True
     
-    # Yellow/Orange progress bar for medium risk
-    style.configure('yellow.Horizontal.TProgressbar',
-                   background='#8a8a4a',
-                   troughcolor='#1a1a1a',
-                   borderwidth=0,
-                   lightcolor='#aaaa6a',
-                   darkcolor='#8a8a4a')
+    get_style().theme_use('clam')
+
+
+# Risk bands used for color coding: scores up to RISK_LOW are low risk,
+# up to RISK_MEDIUM medium risk, and anything above is high risk
+RISK_BAND_CUTS = (RISK_LOW, RISK_MEDIUM)
+# Row tags as ready-made tuples, so table updates pass shared tuples
+# instead of building a new one per row
+RISK_BAND_TAGS = (("low_risk",), ("medium_risk",), ("high_risk",))
+LOCKED_USER_TAGS = ("locked_user",)
+
+
+def risk_bands(risk_scores):
+    """
+    Get the risk band index for every score at once.
     
-    # Red progress bar for high risk and locked users
-    style.configure('red.Horizontal.TProgressbar',
-                   background='#8a4a4a',
-                   troughcolor='#1a1a1a',
-                   borderwidth=0,
-                   lightcolor='#aa6a6a',
-                   darkcolor='#8a4a4a')
+    Args:
+        risk_scores: NumPy array of user risk scores
+        
+    Returns:
+        Integer array of band indexes: 0 (low), 1 (medium) or 2 (high)
+    """
+    return np.searchsorted(RISK_BAND_CUTS, risk_scores, side='left')
 
 
 def configure_table_tags(user_table):
@@ -48,8 +74,13 @@ def configure_table_tags(user_table):
     Tags are applied to rows based on risk score ranges.
     
     Args:
-        user_table: The ttk.Treeview table to configure
+        user_table: The ttk.Treeview table to configure (repeat calls on the
+            same table are no-ops)
     """
+    if user_table in _tagged_tables:
+        return
+    _tagged_tables.add(user_table)
+    
     # Configure color tags for risk level visualization
     # Enhanced with foreground colors and locked user highlighting
     user_table.tag_configure("low_risk", background="#2d4a2d", foreground="#88ff88")    # Green for low risk
@@ -58,8 +89,8 @@ def configure_table_tags(user_table):
     user_table.tag_configure("locked_user", background="#3a1a1a", foreground="#ff6666")  # Special styling for locked users
 
 
-# Color constants for consistent styling
-COLORS = {
+# Color constants for consistent styling (read-only)
+COLORS = MappingProxyType({
     'bg_dark': '#1e1e1e',      # Main background
     'bg_panel': '#2a2a2a',     # Panel background
     'fg_white': 'white',        # White text
@@ -69,10 +100,14 @@ COLORS = {
     'fg_alert': '#ff5555',      # Alert red
     'fg_stats': '#88cc88',      # Statistics green
     'fg_locked': '#ff6666',     # Locked user red
-}
+    'bar_trough': '#1a1a1a',    # Risk bar trough
+    'bar_green': '#4a8a4a',     # Risk bar low risk
+    'bar_yellow': '#8a8a4a',    # Risk bar medium risk
+    'bar_red': '#8a4a4a',       # Risk bar high risk / locked
+})
 
-# Font configurations
-FONTS = {
+# Font configurations; exposed read-only through FONTS below
+_FONT_SPECS = {
     'title': ('Segoe UI', 22, 'bold'),
     'heading': ('Segoe UI', 14, 'bold'),
     'button': ('Segoe UI', 11, 'bold'),
@@ -81,4 +116,25 @@ FONTS = {
     'small_bold': ('Segoe UI', 9, 'bold'),
     'tiny': ('Segoe UI', 9),
 }
+FONTS = MappingProxyType(_FONT_SPECS)
+
+
+def init_fonts(root):
+    """
+    Replace the FONTS tuples with named tkfont.Font objects so Tk parses each
+    font description once instead of once per widget. Call once after the
+    root window exists and before building widgets.
+    
+    Args:
+        root: Tkinter root window
+    """
+    for name, spec in _FONT_SPECS.items():
+        if isinstance(spec, tuple):
+            family, size, *style = spec
+            _FONT_SPECS[name] = tkfont.Font(
+                root=root,
+                family=family,
+                size=size,
+                weight='bold' if 'bold' in style else 'normal'
+            )
 
@@ -20,35 +20,99 @@ Run this file to start the application:
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime
-import random
+import threading
 import csv
+from concurrent.futures import ThreadPoolExecutor
 import os
+from operator import itemgetter
+import numpy as np
 
 # Import configuration
 from config import (
-    USERS, RISK_RULES, RISK_THRESHOLD, RISK_LOW, RISK_MEDIUM, RISK_HIGH,
-    RISK_DECAY_INTERVAL, RISK_DECAY_AMOUNT, SIMULATION_INTERVAL,
+    USERS, RISK_RULES, RISK_THRESHOLD, RISK_HIGH,
+    RISK_DECAY_INTERVAL, RISK_DECAY_AMOUNT, SIMULATION_INTERVAL, SIMULATION_DRAW_BATCH,
+    EVENT_BATCH_SIZE, EVENT_FLUSH_INTERVAL, EVENT_LOAD_BATCH_SIZE, DB_STATUS_INTERVAL,
     USER_STATUS_ACTIVE, USER_STATUS_LOCKED,
-    AI_ANOMALY_RISK_PENALTY, AI_RETRAIN_INTERVAL,
-    SENTIMENT_ANALYSIS_PROBABILITY
+    AI_ANOMALY_RISK_PENALTY, AI_RETRAIN_INTERVAL, AI_TRAINING_POLL_INTERVAL,
+    SENTIMENT_ANALYSIS_PROBABILITY, MAX_ACTIVITY_ROWS, MAX_INCIDENT_ROWS, EXPORT_POLL_INTERVAL,
+    LOG_HISTORY_LIMIT
 )
 
 # Import GUI components and styles
 from gui_components import (
     build_user_table, build_logs, build_statistics,
-    build_monitoring_controls, build_controls
+    build_monitoring_controls, build_controls, batch_update, update_progress_row,
+    UIUpdateBatcher, PeriodicScheduler, append_row, clear_log, defer_redraw, PAUSE_LABEL, RESUME_LABEL
+)
+from gui_styles import (
+    COLORS, FONTS, init_fonts, risk_bands, RISK_BAND_TAGS, LOCKED_USER_TAGS
 )
-from gui_styles import COLORS, FONTS
 
 # Import detection modules
 from detection import (
-    AnomalyDetector, SentimentAnalyzer, SecurityPointsManager, verify_textblob_setup
+    AnomalyDetector, SentimentAnalyzer, SecurityPointsManager, verify_textblob_setup,
+    sentiment_table_ready, current_timestamp, TIMESTAMP_FORMAT
+)
+from user_state import (
+    UserValues, RiskScores, UserStatuses, STATUS_ACTIVE_CODE, STATUS_LOCKED_CODE
 )
 
 # Import database and data loading modules
 from storage import DatabaseManager
 from data_loader import DataLoader
 
+# Simulation choices, built once instead of on every tick
+_USER_IDS = tuple(USERS)
+_USER_ROLES = {user_id: user_info["role"] for user_id, user_info in USERS.items()}
+_ACTIVITY_CODES = tuple(RISK_RULES)
+
+# Human-readable descriptions for activity codes
+_ACTIVITY_DESCRIPTIONS = {
+    "normal": "Normal Activity",
+    "file_download": "File Download Detected",
+    "login_from_unusual_ip": "Login from Unusual IP Address",
+    "access_sensitive_folder": "Access to Sensitive Folder",
+    "data_copy_to_usb": "Data Copy to USB Device"
+}
+
+# User row styling, resolved once and indexed by style: the risk band
+# (0 low, 1 medium, 2 high) or _LOCKED_STYLE for locked accounts.
+# Bar styles are (bar_color, status_text, status_color).
+_LOCKED_STYLE = 3
+_ROW_TAGS = RISK_BAND_TAGS + (LOCKED_USER_TAGS,)
+_STYLE_STATUSES = (USER_STATUS_ACTIVE,) * len(RISK_BAND_TAGS) + (USER_STATUS_LOCKED,)
+_BAR_STYLES = (
+    (COLORS['bar_green'], "", COLORS['bg_panel']),
+    (COLORS['bar_yellow'], "", COLORS['bg_panel']),
+    (COLORS['bar_red'], "⚠ HIGH", COLORS['fg_red']),
+    (COLORS['bar_red'], "🔒 LOCKED", COLORS['fg_locked']),
+)
+# Risk score text color per risk band
+_RISK_TEXT_COLORS = (COLORS['fg_green'], COLORS['fg_yellow'], COLORS['fg_red'])
+
+
+def _simulation_draws(batch_size=SIMULATION_DRAW_BATCH):
+    """
+    Endless stream of random simulation draws, generated batch_size at a
+    time so each tick only advances an iterator.
+    
+    Args:
+        batch_size: Number of draws generated per refill
+        
+    Yields:
+        Tuples of (user_id, activity_code, sentiment_roll), where
+        sentiment_roll is uniform in [0, 1)
+    """
+    rng = np.random.default_rng()
+    user_ids = np.array(_USER_IDS, dtype=object)
+    activity_codes = np.array(_ACTIVITY_CODES, dtype=object)
+    while True:
+        yield from zip(
+            user_ids[rng.integers(len(user_ids), size=batch_size)].tolist(),
+            activity_codes[rng.integers(len(activity_codes), size=batch_size)].tolist(),
+            rng.random(batch_size).tolist(),
+        )
+
 
 class InsiderThreatApp:
     """
@@ -71,17 +135,20 @@ class InsiderThreatApp:
         self.root.title("Insider Threat Predictor")
         self.root.geometry("1300x750")
         self.root.configure(bg=COLORS['bg_dark'])
+        init_fonts(self.root)
 
         # Initialize data structures
-        self.risk_scores = {user_id: 0 for user_id in USERS.keys()}
-        self.user_status = {user_id: USER_STATUS_ACTIVE for user_id in USERS.keys()}
-        self.security_points = {user_id: 0.0 for user_id in USERS.keys()}
+        self.risk_scores = RiskScores(USERS)
+        self.user_status = UserStatuses(USERS)
+        self.security_points = UserValues(USERS, 0.0)
         
         # Initialize state
         self.simulation_active = False
         self.monitoring_running = False
         self.total_activities = 0
+        self.incident_count = 0
         self.use_real_events = False  # Flag to track if using real events from DB
+        self.simulation_draws = _simulation_draws()
         
         # Initialize database connection
         default_uri = mongodb_uri or "mongodb://localhost:27017/"
@@ -91,18 +158,46 @@ class InsiderThreatApp:
         # Initialize detection modules
         self.anomaly_detector = AnomalyDetector()
         
-        # Build UI
-        self.build_ui()
+        # Model retraining runs on a worker thread so it never blocks the Tk loop
+        self.training_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-training")
+        self.training_job = None
+        
+        # Tick-path MongoDB calls run on one worker thread, in submission order,
+        # so network round-trips overlap the wait between ticks
+        self.db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mongodb")
+        self.event_fetch_job = None  # Next-event claim queued at the end of the previous tick
+        self.pending_events = []  # Simulated events waiting for the next batch insert
+        
+        # CSV exports are written on a worker thread from a snapshot of the log
+        self.export_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-export")
+        
+        # Widget updates are coalesced and flushed at a bounded redraw rate
+        self.ui_batcher = UIUpdateBatcher(self.root)
+        
+        # Periodic work (simulation, risk decay, DB housekeeping) shares one Tk timer
+        self.scheduler = PeriodicScheduler(self.root)
+        
+        # Build UI; layout and drawing happen once, after every panel exists
+        with defer_redraw(self.root):
+            self.build_ui()
         
         # Show data input dialog on startup (if DB connected)
         if self.db_connected:
             self.show_data_input_dialog()
         
         # Start risk decay timer
-        self.start_risk_decay()
+        self.scheduler.every('risk_decay', RISK_DECAY_INTERVAL, self.apply_risk_decay)
         
-        # Verify TextBlob setup
-        verify_textblob_setup()
+        # Periodically save queued simulated events, so small batches also land
+        if self.db_connected:
+            self.scheduler.every('event_flush', EVENT_FLUSH_INTERVAL, self.flush_pending_events)
+        
+        # Verify TextBlob setup off the UI thread so the window appears without
+        # waiting for the TextBlob/NLTK import
+        threading.Thread(target=verify_textblob_setup, daemon=True).start()
+        
+        # Closing the window must hand back a prefetched event claim first
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def show_data_input_dialog(self):
         """
@@ -261,6 +356,7 @@ class InsiderThreatApp:
             fg=COLORS['fg_alert']
         )
         self.summary_label.pack(anchor="w", padx=22)
+        self.summary_counts = (0, 0)  # (high-risk users, incidents) shown in summary_label
 
         # Control buttons
         self.pause_button = build_controls(
@@ -271,23 +367,21 @@ class InsiderThreatApp:
         )
         
         # Log tables
-        self.activity_table, self.incident_table = build_logs(self.root)
+        self.activity_table, self.activity_log, self.incident_table, self.incident_log = build_logs(self.root)
         
         # User table
-        self.user_table, self.progress_bars_frame, self.user_progress_bars = build_user_table(self.root)
+        self.user_table, self.progress_canvas, self.risk_bars = build_user_table(self.root)
+        self.rendered_user_rows = {}  # user_id -> (values, tags) last shown in user_table
         
         # Statistics
-        self.stats_total_activities_label, self.stats_avg_risk_label, self.stats_max_risk_label = build_statistics(self.root)
+        self.stats_total_activities_var, self.stats_avg_risk_var, self.stats_max_risk_var = build_statistics(self.root)
         
         # Initial refresh
         self.refresh_users()
         
         # Schedule periodic database status updates
-        if hasattr(self, 'db_status_label'):
-            self.update_db_status_periodic()
-        
-        # Schedule periodic database status updates
-        self.update_db_status_periodic()
+        self.update_db_status()
+        self.scheduler.every('db_status', DB_STATUS_INTERVAL, self.update_db_status)
 
     def simulate_activity(self):
         """
@@ -297,13 +391,17 @@ class InsiderThreatApp:
         if not self.monitoring_running or not self.simulation_active:
             return
         
+        simulated_user, simulated_activity, sentiment_roll = next(self.simulation_draws)
+        risk_scores = self.risk_scores
+        user_status = self.user_status
+        
         # Try to get real event from database first
         real_event = None
         event_details = ''
         
         if self.db_connected and self.use_real_events:
             try:
-                real_event = self.db_manager.get_next_unprocessed_event()
+                real_event = self.fetch_next_event()
             except Exception as e:
                 print(f"Error getting event from database: {e}")
                 real_event = None
@@ -328,10 +426,6 @@ class InsiderThreatApp:
                 
                 risk_increase = real_event.get('risk_increase', RISK_RULES.get(selected_activity, 0))
                 
-                # Mark event as processed
-                if '_id' in real_event:
-                    self.db_manager.mark_event_processed(real_event['_id'])
-                
                 # Use enhanced details if available
                 event_details = real_event.get('details', '')
             except Exception as e:
@@ -341,37 +435,37 @@ class InsiderThreatApp:
         
         if not real_event:
             # Fall back to random simulation if no real events available
-            selected_user = random.choice(list(USERS.keys()))
-            selected_activity = random.choice(list(RISK_RULES.keys()))
+            selected_user = simulated_user
+            selected_activity = simulated_activity
             risk_increase = RISK_RULES[selected_activity]
             event_details = ''
 
-        if self.user_status[selected_user] == USER_STATUS_ACTIVE:
-            self.risk_scores[selected_user] = max(0, self.risk_scores[selected_user] + risk_increase)
-            SecurityPointsManager.award_points(selected_user, risk_increase, self.risk_scores, self.security_points)
+        if user_status[selected_user] == USER_STATUS_ACTIVE:
+            risk_scores[selected_user] = max(0, risk_scores[selected_user] + risk_increase)
+            SecurityPointsManager.award_points(selected_user, risk_increase, risk_scores, self.security_points)
         else:
             risk_increase = 0
 
         # Use timestamp from real event if available, otherwise use current time
         if real_event and 'timestamp' in real_event:
             if isinstance(real_event['timestamp'], datetime):
-                timestamp = real_event['timestamp'].strftime("%Y-%m-%d %H:%M:%S")
+                timestamp = real_event['timestamp'].strftime(TIMESTAMP_FORMAT)
             else:
                 timestamp = real_event['timestamp']
         else:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = current_timestamp()
         
-        activity_description = self.get_activity_description(selected_activity)
+        activity_description = _ACTIVITY_DESCRIPTIONS.get(selected_activity, selected_activity)
         if event_details:
             activity_description += f" - {event_details}"
         
         self.total_activities += 1
         
-        self.activity_table.insert("", 0, values=(timestamp, selected_user, activity_description, risk_increase))
+        self.log_activity((timestamp, selected_user, activity_description, risk_increase))
         
         # Save event to database if not already there (for simulated events)
         if not real_event and self.db_connected:
-            self.db_manager.save_event({
+            self.pending_events.append({
                 'timestamp': timestamp,
                 'user_id': selected_user,
                 'activity': selected_activity,
@@ -379,51 +473,116 @@ class InsiderThreatApp:
                 'details': event_details,
                 'source': 'simulation'
             })
+            if len(self.pending_events) >= EVENT_BATCH_SIZE:
+                self.flush_pending_events()
 
         # AI Anomaly Detection
-        if self.user_status[selected_user] == USER_STATUS_ACTIVE:
-            if self.anomaly_detector.detect_anomaly(selected_user, self.risk_scores):
-                self.risk_scores[selected_user] = max(0, self.risk_scores[selected_user] + AI_ANOMALY_RISK_PENALTY)
+        if user_status[selected_user] == USER_STATUS_ACTIVE:
+            if self.anomaly_detector.detect_anomaly(selected_user, risk_scores):
+                risk_scores[selected_user] = max(0, risk_scores[selected_user] + AI_ANOMALY_RISK_PENALTY)
                 self.raise_ai_alert(selected_user, AI_ANOMALY_RISK_PENALTY)
-                if self.risk_scores[selected_user] >= RISK_THRESHOLD:
+                if risk_scores[selected_user] >= RISK_THRESHOLD:
                     self.raise_incident(selected_user)
 
-        # Sentiment Analysis
-        if random.random() < SENTIMENT_ANALYSIS_PROBABILITY:
+        # Sentiment Analysis (skipped until the background warm-up has built the
+        # sentiment table, so TextBlob never runs on the Tk thread)
+        if sentiment_roll < SENTIMENT_ANALYSIS_PROBABILITY and sentiment_table_ready():
             risk_inc, self.total_activities = SentimentAnalyzer.analyze_sentiment(
-                selected_user, self.user_status[selected_user],
-                self.risk_scores, self.activity_table, self.total_activities
+                selected_user, user_status[selected_user],
+                risk_scores, self.log_activity, self.total_activities
             )
-            if self.risk_scores[selected_user] >= RISK_THRESHOLD:
+            if risk_scores[selected_user] >= RISK_THRESHOLD:
                 self.raise_incident(selected_user)
 
         # Check threshold
-        if self.risk_scores[selected_user] >= RISK_THRESHOLD:
+        if risk_scores[selected_user] >= RISK_THRESHOLD:
             self.raise_incident(selected_user)
 
         # Collect training data and retrain
-        self.anomaly_detector.collect_training_data(self.risk_scores)
+        self.anomaly_detector.collect_training_data(risk_scores)
         if self.anomaly_detector.activities_since_training >= AI_RETRAIN_INTERVAL:
-            self.anomaly_detector.train_model()
+            self.start_model_training()
             self.anomaly_detector.activities_since_training = 0
         else:
             self.anomaly_detector.activities_since_training += 1
 
+        # Start claiming the next event now, behind this tick's writes
+        if self.db_connected and self.use_real_events:
+            self.event_fetch_job = self.db_pool.submit(self.db_manager.claim_next_event)
+
         # Refresh UI
-        self.refresh_users()
-        self.update_statistics()
-        self.root.after(SIMULATION_INTERVAL, self.simulate_activity)
+        self.schedule_refresh()
+    
+    def flush_pending_events(self, durable=False):
+        """
+        Queue one batch insert of the simulated events saved up so far.
+        
+        Args:
+            durable: Wait for the server to acknowledge the insert. Simulated
+                events are only a record of the run, so periodic flushes don't
+        """
+        if not self.pending_events:
+            return
+        
+        events, self.pending_events = self.pending_events, []
+        self.db_pool.submit(self.db_manager.save_events_batch, events, durable=durable)
     
-    def get_activity_description(self, activity_code):
-        """Convert activity code to human-readable description."""
-        descriptions = {
-            "normal": "Normal Activity",
-            "file_download": "File Download Detected",
-            "login_from_unusual_ip": "Login from Unusual IP Address",
-            "access_sensitive_folder": "Access to Sensitive Folder",
-            "data_copy_to_usb": "Data Copy to USB Device"
-        }
-        return descriptions.get(activity_code, activity_code)
+    def fetch_next_event(self):
+        """
+        Claim the next unprocessed event from the database (it comes back
+        already marked processed). Uses the claim queued by the previous tick,
+        which has usually finished by now, and only waits on the database
+        when there is none.
+        
+        Returns:
+            Event dictionary or None if no events are available
+        """
+        fetch_job = self.event_fetch_job
+        self.event_fetch_job = None
+        if fetch_job is None:
+            fetch_job = self.db_pool.submit(self.db_manager.claim_next_event)
+        return fetch_job.result()
+    
+    def release_prefetched_event(self, fetch_job):
+        """
+        Put an event claimed ahead of time, but never used, back in the queue.
+        Runs on the MongoDB worker, after fetch_job has finished.
+        
+        Args:
+            fetch_job: Future from a claim_next_event submission
+        """
+        event = fetch_job.result()
+        if event and '_id' in event:
+            self.db_manager.release_event(event['_id'])
+    
+    def start_model_training(self):
+        """
+        Fit a new anomaly model on a snapshot of the training data in the
+        background. Skipped while a previous training job is still running;
+        the next retrain interval picks up the newer data.
+        """
+        if self.training_job is not None:
+            return
+        
+        training_data = self.anomaly_detector.training_snapshot()
+        if training_data is None:
+            return
+        
+        detector = self.anomaly_detector
+        self.training_job = self.training_pool.submit(detector.fit_model, training_data)
+        self.root.after(AI_TRAINING_POLL_INTERVAL, self.finish_model_training, detector)
+    
+    def finish_model_training(self, detector):
+        """Install the model from the background training job once it is done."""
+        if not self.training_job.done():
+            self.root.after(AI_TRAINING_POLL_INTERVAL, self.finish_model_training, detector)
+            return
+        
+        model = self.training_job.result()
+        self.training_job = None
+        # A reset replaces the detector; drop models trained on the old data
+        if detector is self.anomaly_detector:
+            detector.model = model
     
     def start_monitoring(self):
         """Start the monitoring system."""
@@ -433,27 +592,57 @@ class InsiderThreatApp:
             self.start_button.config(state="disabled")
             self.stop_button.config(state="normal")
             self.pause_button.config(state="normal")
-            self.simulate_activity()
+            self.start_simulation()
     
     def stop_monitoring(self):
         """Stop the monitoring system."""
         if self.monitoring_running:
             self.monitoring_running = False
             self.simulation_active = False
+            self.scheduler.cancel('simulation')
+            self.flush_pending_events()
+            if self.event_fetch_job is not None:
+                self.db_pool.submit(self.release_prefetched_event, self.event_fetch_job)
+                self.event_fetch_job = None
             self.start_button.config(state="normal")
             self.stop_button.config(state="disabled")
             self.pause_button.config(state="disabled")
     
+    def on_close(self):
+        """
+        Stop monitoring and let the background workers finish before the
+        window is destroyed, so simulated events still queued are saved and
+        an event claimed ahead of time is released back to the queue rather
+        than left marked processed.
+        """
+        # Acknowledged, since the client is closed right after
+        self.flush_pending_events(durable=True)
+        self.stop_monitoring()
+        self.scheduler.cancel('event_flush')
+        
+        # Queued database calls (including the release) run to completion
+        self.db_pool.shutdown(wait=True)
+        self.export_pool.shutdown(wait=True)
+        self.training_pool.shutdown(wait=False, cancel_futures=True)
+        self.db_manager.close()
+        self.root.destroy()
+    
     def toggle_simulation(self):
         """Toggle the simulation between paused and active states."""
         if not self.monitoring_running:
             return
         self.simulation_active = not self.simulation_active
         if self.simulation_active:
-            self.pause_button.config(text="⏸ Pause")
-            self.simulate_activity()
+            self.pause_button.config(text=PAUSE_LABEL)
+            self.start_simulation()
         else:
-            self.pause_button.config(text="▶ Resume")
+            self.pause_button.config(text=RESUME_LABEL)
+            self.scheduler.cancel('simulation')
+    
+    def start_simulation(self):
+        """Run one simulation tick now, then one every SIMULATION_INTERVAL."""
+        self.simulate_activity()
+        self.scheduler.every('simulation', SIMULATION_INTERVAL, self.simulate_activity)
     
     def reset_all_risk_scores(self):
         """Reset all risk scores, clear logs, and unlock all users."""
@@ -466,27 +655,22 @@ class InsiderThreatApp:
         if not confirm:
             return
         
-        for user_id in self.risk_scores:
-            self.risk_scores[user_id] = 0
-        for user_id in self.user_status:
-            self.user_status[user_id] = USER_STATUS_ACTIVE
-        for user_id in self.security_points:
-            self.security_points[user_id] = 0.0
+        self.risk_scores.reset()
+        self.user_status.reset()
+        self.security_points.reset()
         
-        for item_id in self.activity_table.get_children():
-            self.activity_table.delete(item_id)
-        for item_id in self.incident_table.get_children():
-            self.incident_table.delete(item_id)
+        clear_log(self.activity_table, self.activity_log)
+        clear_log(self.incident_table, self.incident_log)
         
         self.total_activities = 0
+        self.incident_count = 0
         self.anomaly_detector = AnomalyDetector()
         
         # Clear database events if connected
         if self.db_connected:
-            self.db_manager.clear_processed_events()
+            self.db_pool.submit(self.db_manager.clear_processed_events)
         
-        self.refresh_users()
-        self.update_statistics()
+        self.schedule_refresh()
         messagebox.showinfo("Reset Complete", "All risk scores, logs, and incidents have been cleared.\nAll users have been unlocked.\nAI model has been reset.")
     
     def load_events_from_url(self, url: str):
@@ -500,37 +684,12 @@ class InsiderThreatApp:
             messagebox.showerror("Error", "MongoDB is not connected. Please check your connection.")
             return
         
-        try:
-            # Show loading message
-            self.root.update()  # Update UI before showing message
-            
-            # Load events from URL
-            events, error = DataLoader.load_from_url(url)
-            
-            if error:
-                messagebox.showerror("Error", f"Failed to load data from URL:\n{error}")
-                return
-            
-            if not events:
-                messagebox.showwarning("Warning", "No valid events found in the URL data.")
-                return
-            
-            # Save events to database
-            saved_count = self.db_manager.save_events_batch(events)
-            
-            if saved_count > 0:
-                self.use_real_events = True
-                messagebox.showinfo(
-                    "Success",
-                    f"Successfully loaded {saved_count} events from URL!\n\n"
-                    f"Events will be processed when you start monitoring."
-                )
-                self.update_db_status()
-            else:
-                messagebox.showerror("Error", "Failed to save events to database.")
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Error loading from URL:\n{str(e)}")
+        events, error = DataLoader.stream_from_url(url)
+        if error:
+            messagebox.showerror("Error", f"Failed to load data from URL:\n{error}")
+            return
+        
+        self.save_loaded_events(events, "URL", "")
     
     def load_events_from_file(self, file_path: str):
         """
@@ -543,35 +702,72 @@ class InsiderThreatApp:
             messagebox.showerror("Error", "MongoDB is not connected. Please check your connection.")
             return
         
+        events, error = DataLoader.stream_from_file(file_path)
+        if error:
+            messagebox.showerror("Error", f"Failed to load data from file:\n{error}")
+            return
+        
+        self.save_loaded_events(events, "file", f"File: {os.path.basename(file_path)}\n")
+    
+    def save_loaded_events(self, events, source_name, source_details):
+        """
+        Save a stream of loaded events to the database in chunks of
+        EVENT_LOAD_BATCH_SIZE. Each chunk is inserted on the MongoDB worker while the next one is
+        parsed, so at most two chunks of a large file or URL are held in memory.
+        
+        Args:
+            events: Iterator of normalized events from DataLoader.stream_from_*
+            source_name: "file" or "URL", used in the result messages
+            source_details: Extra line(s) for the success message
+        """
+        loaded_count = 0
+        saved_count = 0
+        save_job = None  # Insert of the previous chunk, still running on the worker
+        batch = []
         try:
-            # Load events from file
-            events, error = DataLoader.load_from_file(file_path)
-            
-            if error:
-                messagebox.showerror("Error", f"Failed to load data from file:\n{error}")
-                return
-            
-            if not events:
-                messagebox.showwarning("Warning", "No valid events found in the file.")
-                return
-            
-            # Save events to database
-            saved_count = self.db_manager.save_events_batch(events)
-            
+            for event in events:
+                batch.append(event)
+                if len(batch) >= EVENT_LOAD_BATCH_SIZE:
+                    loaded_count += len(batch)
+                    if save_job is not None:
+                        saved_count += save_job.result()
+                    save_job = self.db_pool.submit(self.db_manager.save_events_batch, batch)
+                    batch = []
+            if batch:
+                loaded_count += len(batch)
+                if save_job is not None:
+                    saved_count += save_job.result()
+                save_job = self.db_pool.submit(self.db_manager.save_events_batch, batch)
+            if save_job is not None:
+                saved_count += save_job.result()
+                save_job = None
+        except Exception as e:
+            # Count a chunk that was still being inserted, unless it is the one that failed
+            if save_job is not None and save_job.exception() is None:
+                saved_count += save_job.result()
             if saved_count > 0:
                 self.use_real_events = True
-                messagebox.showinfo(
-                    "Success",
-                    f"Successfully loaded {saved_count} events from file!\n\n"
-                    f"File: {os.path.basename(file_path)}\n"
-                    f"Events will be processed when you start monitoring."
-                )
-                self.update_db_status()
-            else:
-                messagebox.showerror("Error", "Failed to save events to database.")
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Error loading from file:\n{str(e)}")
+            self.update_db_status()
+            messagebox.showerror(
+                "Error",
+                f"Error loading from {source_name}:\n{str(e)}\n\n"
+                f"{saved_count} events were saved before the error."
+            )
+            return
+        
+        if saved_count > 0:
+            self.use_real_events = True
+            messagebox.showinfo(
+                "Success",
+                f"Successfully loaded {saved_count} events from {source_name}!\n\n"
+                f"{source_details}"
+                f"Events will be processed when you start monitoring."
+            )
+            self.update_db_status()
+        elif loaded_count > 0:
+            messagebox.showerror("Error", "Failed to save events to database.")
+        else:
+            messagebox.showwarning("Warning", f"No valid events found in the {source_name}.")
     
     def update_db_status(self):
         """Update the database status indicator in the UI."""
@@ -594,133 +790,128 @@ class InsiderThreatApp:
         
         self.db_status_label.config(text=status_text, fg=status_color)
     
-    def update_db_status_periodic(self):
-        """Periodically update database status indicator."""
-        self.update_db_status()
-        # Update every 5 seconds
-        self.root.after(5000, self.update_db_status_periodic)
-    
-    def start_risk_decay(self):
-        """Start the risk decay timer."""
-        for user_id in self.risk_scores:
-            old_score = self.risk_scores[user_id]
-            self.risk_scores[user_id] = max(0, old_score - RISK_DECAY_AMOUNT)
-            
-            SecurityPointsManager.award_decay_points(user_id, self.user_status[user_id], self.security_points)
-            
-            if (self.user_status[user_id] == USER_STATUS_LOCKED and 
-                self.risk_scores[user_id] == 0 and old_score > 0):
-                self.user_status[user_id] = USER_STATUS_ACTIVE
+    def apply_risk_decay(self):
+        """Apply one risk decay step; run every RISK_DECAY_INTERVAL by the scheduler."""
+        old_scores = self.risk_scores.decay(RISK_DECAY_AMOUNT)
+        status_codes = self.user_status.array
+        
+        SecurityPointsManager.award_decay_points_bulk(status_codes, self.security_points.array)
+        
+        # Unlock locked users whose risk has just decayed to zero
+        unlock = (status_codes == STATUS_LOCKED_CODE) & (self.risk_scores.array == 0) & (old_scores > 0)
+        status_codes[unlock] = STATUS_ACTIVE_CODE
         
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        """
+        Queue a refresh of the user table, risk bars and statistics. Repeated
+        calls before the refresh runs collapse into one, and refreshes run at
+        most at the UI batcher's rate.
+        """
+        self.ui_batcher.update('dashboard', self.refresh_dashboard)
+    
+    def refresh_dashboard(self):
+        """Refresh the user table, risk bars and statistics now."""
         self.refresh_users()
         self.update_statistics()
-        self.root.after(RISK_DECAY_INTERVAL, self.start_risk_decay)
 
     def refresh_users(self):
         """Refresh the user risk scores table with current data."""
-        for row_id in self.user_table.get_children():
-            self.user_table.delete(row_id)
-
-        high_risk_count = 0
-        for user_id, user_info in USERS.items():
-            current_risk_score = self.risk_scores[user_id]
-            current_status = self.user_status[user_id]
-            
-            if current_risk_score >= RISK_THRESHOLD:
-                high_risk_count += 1
-
-            if current_status == USER_STATUS_LOCKED:
-                risk_tag = "locked_user"
-            elif current_risk_score <= RISK_LOW:
-                risk_tag = "low_risk"
-            elif current_risk_score <= RISK_MEDIUM:
-                risk_tag = "medium_risk"
-            else:
-                risk_tag = "high_risk"
-
-            security_score = self.security_points[user_id]
-            self.user_table.insert("", "end",
-                values=(user_id, user_info["role"], current_risk_score, current_status, f"{security_score:.1f}"),
-                tags=(risk_tag,))
+        # Classify every user at once; the state arrays follow USERS order
+        risk_array = self.risk_scores.array
+        bands = risk_bands(risk_array)
+        styles = np.where(self.user_status.array == STATUS_LOCKED_CODE, _LOCKED_STYLE, bands)
+        high_risk_count = int(np.count_nonzero(risk_array >= RISK_THRESHOLD))
+        
+        table_rows = []
+        add_row = table_rows.append
+        update_bar = self.update_user_progress_bar
+        row_tags, style_statuses = _ROW_TAGS, _STYLE_STATUSES
+        for (user_id, user_role), current_risk_score, band, style, security_score in zip(
+            _USER_ROLES.items(), risk_array.tolist(), bands.tolist(), styles.tolist(),
+            self.security_points.array.tolist()
+        ):
+            add_row((
+                user_id,
+                (user_id, user_role, current_risk_score, style_statuses[style], f"{security_score:.1f}"),
+                row_tags[style]
+            ))
             
-            self.update_user_progress_bar(user_id, current_risk_score, current_status)
+            update_bar(user_id, current_risk_score, band, style)
+        
+        batch_update(self.user_table, table_rows, self.rendered_user_rows)
 
-        incident_count = len(self.incident_table.get_children())
-        self.summary_label.config(
-            text=f"Total High-Risk Users: {high_risk_count}     Incidents Logged: {incident_count}"
-        )
+        summary_counts = (high_risk_count, self.incident_count)
+        if summary_counts != self.summary_counts:
+            self.summary_counts = summary_counts
+            self.summary_label.config(
+                text=f"Total High-Risk Users: {high_risk_count}     Incidents Logged: {self.incident_count}"
+            )
     
-    def update_user_progress_bar(self, user_id, risk_score, status):
-        """Update the progress bar and visual indicators for a specific user."""
-        if not hasattr(self, 'user_progress_bars') or user_id not in self.user_progress_bars:
+    def update_user_progress_bar(self, user_id, risk_score, band, style):
+        """
+        Update the progress bar and visual indicators for a specific user.
+        
+        Args:
+            user_id: User whose row to update
+            risk_score: Current risk score
+            band: Risk band index of the score (see risk_bands)
+            style: Index into _BAR_STYLES; the band, or _LOCKED_STYLE
+        """
+        if not hasattr(self, 'risk_bars'):
             return
         
-        try:
-            progress_bar = self.user_progress_bars[user_id]['progress_bar']
-            risk_label = self.user_progress_bars[user_id]['risk_label']
-            status_indicator = self.user_progress_bars[user_id]['status_indicator']
-        except (KeyError, TypeError):
+        row = self.risk_bars.index.get(user_id)
+        if row is None:
             return
         
         progress_value = min(risk_score, RISK_THRESHOLD)
-        progress_bar['value'] = progress_value
+        bar_color, status_text, status_color = _BAR_STYLES[style]
         
-        try:
-            if status == USER_STATUS_LOCKED:
-                progress_bar['style'] = 'red.Horizontal.TProgressbar'
-                status_indicator.config(text="🔒 LOCKED", fg=COLORS['fg_locked'])
-            elif risk_score <= RISK_LOW:
-                progress_bar['style'] = 'green.Horizontal.TProgressbar'
-                status_indicator.config(text="", fg=COLORS['bg_panel'])
-            elif risk_score <= RISK_MEDIUM:
-                progress_bar['style'] = 'yellow.Horizontal.TProgressbar'
-                status_indicator.config(text="", fg=COLORS['bg_panel'])
-            else:
-                progress_bar['style'] = 'red.Horizontal.TProgressbar'
-                status_indicator.config(text="⚠ HIGH", fg=COLORS['fg_red'])
-            
-            if risk_score <= RISK_LOW:
-                risk_label.config(text=str(risk_score), fg=COLORS['fg_green'])
-            elif risk_score <= RISK_MEDIUM:
-                risk_label.config(text=str(risk_score), fg=COLORS['fg_yellow'])
-            else:
-                risk_label.config(text=str(risk_score), fg=COLORS['fg_red'])
-        except Exception:
-            pass
+        update_progress_row(
+            self.risk_bars, row, progress_value, bar_color, str(risk_score),
+            _RISK_TEXT_COLORS[band], status_text, status_color
+        )
     
     def update_statistics(self):
         """Update the statistics panel with current calculated metrics."""
-        if len(self.risk_scores) > 0:
-            average_risk = sum(self.risk_scores.values()) / len(self.risk_scores)
-        else:
-            average_risk = 0
+        average_risk = self.risk_scores.average()
+        max_risk_score = self.risk_scores.max_score
         
-        max_risk_score = max(self.risk_scores.values()) if self.risk_scores else 0
-        
-        self.stats_total_activities_label.config(text=f"Total Activities: {self.total_activities}")
-        self.stats_avg_risk_label.config(text=f"Average Risk Score: {average_risk:.1f}")
-        self.stats_max_risk_label.config(text=f"Highest Risk Score: {max_risk_score}")
+        self.stats_total_activities_var.set(f"Total Activities: {self.total_activities}")
+        self.stats_avg_risk_var.set(f"Average Risk Score: {average_risk:.1f}")
+        self.stats_max_risk_var.set(f"Highest Risk Score: {max_risk_score}")
+
+    def log_activity(self, row):
+        """Add a row to the activity log."""
+        append_row(self.activity_table, self.activity_log, row, MAX_ACTIVITY_ROWS)
+    
+    def log_incident(self, row):
+        """Add a row to the incident log."""
+        append_row(self.incident_table, self.incident_log, row, MAX_INCIDENT_ROWS)
+        self.incident_count += 1
 
     def raise_incident(self, user_id):
         """Raise an incident alert when a user's risk score exceeds the threshold."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        user_role = USERS[user_id]["role"]
+        timestamp = current_timestamp()
+        user_role = _USER_ROLES[user_id]
         incident_message = f"HIGH-RISK ALERT: {user_id} ({user_role}) triggered security incident - Account LOCKED"
 
-        self.incident_table.insert("", 0, values=(timestamp, user_id, self.risk_scores[user_id], incident_message))
+        self.log_incident((timestamp, user_id, self.risk_scores[user_id], incident_message))
         self.user_status[user_id] = USER_STATUS_LOCKED
         self.risk_scores[user_id] = 0
     
     def raise_ai_alert(self, user_id, risk_penalty):
         """Log an AI-detected anomaly alert."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        user_role = USERS[user_id]["role"]
-        ai_alert_message = f"AI ALERT: {user_id} ({user_role}) - Anomalous behavior detected by Isolation Forest (+{risk_penalty} risk)"
-        self.incident_table.insert("", 0, values=(timestamp, user_id, self.risk_scores[user_id], ai_alert_message))
+        timestamp = current_timestamp()
+        user_role = _USER_ROLES[user_id]
+        ai_alert_message = f"AI ALERT: {user_id} ({user_role}) - Anomalous behavior detected by {self.anomaly_detector.method_label} (+{risk_penalty} risk)"
+        self.log_incident((timestamp, user_id, self.risk_scores[user_id], ai_alert_message))
         
         # Save AI alert to database
         if self.db_connected:
-            self.db_manager.save_incident({
+            self.db_pool.submit(self.db_manager.save_incident, {
                 'timestamp': timestamp,
                 'user_id': user_id,
                 'risk_score': self.risk_scores[user_id],
@@ -729,54 +920,83 @@ class InsiderThreatApp:
                 'alert_type': 'AI_ANOMALY'
             })
 
+    @staticmethod
+    def write_log_csv(filename, header, rows):
+        """
+        Write log rows to CSV. Only touches the rows it is given, so it can
+        run off the Tk thread.
+        
+        Args:
+            filename: Destination CSV path
+            header: Column names
+            rows: Row tuples, in file order
+        """
+        with open(filename, 'w', newline='', encoding='utf-8') as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(header)
+            csv_writer.writerows(rows)
+    
+    def start_export(self, title, header, log, log_name):
+        """
+        Ask for a destination and export a log history to CSV in the background.
+        Rows are copied from the history deque, newest first (the order shown
+        in the tables), before the file is written on the export worker.
+        
+        Args:
+            title: Save dialog title
+            header: Column names
+            log: LogHistory of (item_id, row) pairs from build_logs
+            log_name: Log name used in the result messages, e.g. "Activity log"
+        """
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title=title
+        )
+        if not filename:
+            return
+        
+        rows = list(map(itemgetter(1), reversed(log)))
+        export_job = self.export_pool.submit(self.write_log_csv, filename, header, rows)
+        self.root.after(EXPORT_POLL_INTERVAL, self.finish_export, export_job, filename, log_name, log.dropped)
+    
+    def finish_export(self, export_job, filename, log_name, dropped=0):
+        """Report the result of a background CSV export once it is done."""
+        if not export_job.done():
+            self.root.after(EXPORT_POLL_INTERVAL, self.finish_export, export_job, filename, log_name, dropped)
+            return
+        
+        error = export_job.exception()
+        if error is None:
+            message = f"{log_name} exported to {os.path.basename(filename)}"
+            if dropped:
+                message += (
+                    f"\n\nOnly the most recent {LOG_HISTORY_LIMIT} rows are kept for export; "
+                    f"{dropped} older rows were not written."
+                )
+            messagebox.showinfo("Success", message)
+        else:
+            messagebox.showerror("Error", f"Failed to export {log_name.lower()}: {str(error)}")
+    
     def export_activity_log(self):
         """Export the activity log to a CSV file."""
-        try:
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                title="Export Activity Log"
-            )
-            if not filename:
-                return
-            
-            with open(filename, 'w', newline='', encoding='utf-8') as csv_file:
-                csv_writer = csv.writer(csv_file)
-                csv_writer.writerow(["Time", "User", "Activity", "Risk Increase"])
-                for item_id in self.activity_table.get_children():
-                    row_values = self.activity_table.item(item_id, 'values')
-                    csv_writer.writerow(row_values)
-            
-            messagebox.showinfo("Success", f"Activity log exported to {os.path.basename(filename)}")
-        except Exception as error:
-            messagebox.showerror("Error", f"Failed to export activity log: {str(error)}")
+        self.start_export(
+            "Export Activity Log", ("Time", "User", "Activity", "Risk Increase"), self.activity_log, "Activity log"
+        )
     
     def export_incidents(self):
         """Export incident alerts to a CSV file."""
-        try:
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".csv",
-                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                title="Export Incidents"
-            )
-            if not filename:
-                return
-            
-            with open(filename, 'w', newline='', encoding='utf-8') as csv_file:
-                csv_writer = csv.writer(csv_file)
-                csv_writer.writerow(["Time", "User", "Risk Score", "Message"])
-                for item_id in self.incident_table.get_children():
-                    row_values = self.incident_table.item(item_id, 'values')
-                    csv_writer.writerow(row_values)
-            
-            messagebox.showinfo("Success", f"Incidents exported to {os.path.basename(filename)}")
-        except Exception as error:
-            messagebox.showerror("Error", f"Failed to export incidents: {str(error)}")
-
+        self.start_export(
+            "Export Incidents", ("Time", "User", "Risk Score", "Message"), self.incident_log, "Incidents"
+        )
 
 if __name__ == "__main__":
+    import logging
     import sys
     
+    # Database errors are reported through logging (see storage.py)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    
     # Check for MongoDB URI as command line argument
     mongodb_uri = None
     if len(sys.argv) > 1:
@@ -8,13 +8,91 @@ Collections:
 - events: Raw user activity events from files/URLs
 - incidents: Generated security incidents
 - users: User profiles and metadata
-- risk_scores: Current risk scores for users (for persistence)
+- risk_scores: Current risk score per user, one document each (for persistence)
 """
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument, UpdateOne, WriteConcern
+from pymongo.errors import BulkWriteError
+from bson import ObjectId
 from datetime import datetime
-from typing import List, Dict, Optional
-import json
+from typing import List, Dict, Iterator, Optional
+import importlib.util
+import logging
+import threading
+
+# pymongo imports zstandard itself for zstd wire compression; only offer zstd
+# when it is installed (zlib is always available)
+_COMPRESSORS = "zstd,zlib" if importlib.util.find_spec("zstandard") else "zlib"
+
+
+logger = logging.getLogger(__name__)
+
+# MongoClient options: compress traffic when the server supports it, retry a
+# write once after a failover, and give up on an unreachable server after 5 s
+# (instead of 30 s) so startup and the status check don't hang
+CLIENT_OPTIONS = {
+    "compressors": _COMPRESSORS,
+    "zlibCompressionLevel": 6,
+    "retryWrites": True,
+    "serverSelectionTimeoutMS": 5000,
+    "socketTimeoutMS": 30000,
+}
+
+# Partial index behind the unprocessed-event queue
+QUEUE_INDEX_NAME = "unprocessed_queue"
+
+# Processed events are removed by the server this long after processing (seconds)
+PROCESSED_EVENT_TTL = 7 * 24 * 3600
+
+# Event indexes from earlier versions, replaced by the queue and per-user indexes
+LEGACY_EVENT_INDEXES = ("processed_1", "processed_1_timestamp_1", "user_id_1")
+
+# Incident fields shown when listing incidents
+INCIDENT_FIELDS = {"timestamp": 1, "user_id": 1, "risk_score": 1, "message": 1, "alert_type": 1}
+
+# Event fields read by the monitoring loop when it consumes a queued event
+QUEUE_EVENT_FIELDS = {"timestamp": 1, "user_id": 1, "activity": 1, "risk_increase": 1, "details": 1}
+
+
+# One MongoClient (and connection pool) per connection string, shared by every
+# DatabaseManager in the process: connection_uri -> [client, manager count]
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _acquire_client(connection_uri: str) -> MongoClient:
+    """Return the shared client for connection_uri, creating it on first use."""
+    with _clients_lock:
+        entry = _clients.get(connection_uri)
+        if entry is None:
+            entry = _clients[connection_uri] = [MongoClient(connection_uri, **CLIENT_OPTIONS), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_client(connection_uri: str):
+    """Drop one manager's use of a shared client; close it after the last one."""
+    with _clients_lock:
+        entry = _clients.get(connection_uri)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _clients[connection_uri]
+            entry[0].close()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC."""
+    # Only a 'Z'-suffixed value needs a rewrite before fromisoformat
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _object_id(event_id) -> ObjectId:
+    """Accept an event _id as an ObjectId or its string form."""
+    return event_id if isinstance(event_id, ObjectId) else ObjectId(event_id)
 
 
 class DatabaseManager:
@@ -23,6 +101,11 @@ class DatabaseManager:
     Handles all CRUD operations for events, incidents, and user data.
     """
     
+    __slots__ = (
+        "connection_uri", "client", "db", "events_collection", "unacknowledged_events_collection",
+        "incidents_collection", "users_collection", "risk_scores_collection"
+    )
+    
     def __init__(self, connection_uri: str = "mongodb://localhost:27017/", database_name: str = "insider_threat"):
         """
         Initialize database connection.
@@ -31,27 +114,73 @@ class DatabaseManager:
             connection_uri: MongoDB connection string
             database_name: Name of the database to use
         """
+        self.connection_uri = connection_uri
+        self.client = None
         try:
-            self.client = MongoClient(connection_uri)
+            self.client = _acquire_client(connection_uri)
             self.db = self.client[database_name]
             self.events_collection = self.db["events"]
-            self.incidents_collection = self.db["incidents"]
+            # Fire-and-forget handle for event batches that may be lost
+            self.unacknowledged_events_collection = self.events_collection.with_options(
+                write_concern=WriteConcern(w=0)
+            )
+            # Incidents are rare and security-relevant: wait for a majority
+            self.incidents_collection = self.db.get_collection(
+                "incidents", write_concern=WriteConcern(w="majority")
+            )
             self.users_collection = self.db["users"]
             self.risk_scores_collection = self.db["risk_scores"]
             
             # Create indexes for better query performance
-            self.events_collection.create_index("timestamp")
-            self.events_collection.create_index("user_id")
-            self.events_collection.create_index("processed", sparse=True)
+            self._create_event_indexes()
             self.incidents_collection.create_index("timestamp")
+            self.incidents_collection.create_index([("user_id", 1), ("timestamp", -1)])
             
         except Exception as e:
-            print(f"Database connection error: {e}")
+            logger.error("Database connection error: %s", e)
+            if self.client is not None:
+                _release_client(connection_uri)
             self.client = None
             self.db = None
     
+    def _create_event_indexes(self):
+        """
+        Create the events indexes, dropping the ones earlier versions made
+        that these replace (so the planner has a single candidate).
+        
+        - timestamp: time-range scans
+        - (user_id, timestamp desc): a user's events, newest first; also
+          serves plain user_id lookups
+        - unprocessed queue: filter on processed, oldest first. The index is
+          partial, so it only holds the backlog rather than every event ever
+          loaded
+        - processed_at TTL: the server deletes processed events in the
+          background PROCESSED_EVENT_TTL after they were processed
+        """
+        existing = self.events_collection.index_information()
+        for name in LEGACY_EVENT_INDEXES:
+            if name in existing:
+                self.events_collection.drop_index(name)
+        
+        self.events_collection.create_index("timestamp")
+        self.events_collection.create_index([("user_id", 1), ("timestamp", -1)])
+        self.events_collection.create_index(
+            [("processed", 1), ("timestamp", 1)],
+            partialFilterExpression={"processed": False},
+            name=QUEUE_INDEX_NAME
+        )
+        self.events_collection.create_index(
+            "processed_at",
+            expireAfterSeconds=PROCESSED_EVENT_TTL,
+            partialFilterExpression={"processed": True}
+        )
+    
     def is_connected(self) -> bool:
-        """Check if database connection is active."""
+        """
+        Check if database connection is active (one ping round-trip).
+        This is a health probe for the UI; the operations below only check
+        that a client exists and report connection errors when they happen.
+        """
         if self.client is None:
             return False
         try:
@@ -60,7 +189,7 @@ class DatabaseManager:
         except Exception:
             return False
     
-    def save_event(self, event_data: Dict) -> bool:
+    def save_event(self, event_data: Dict) -> Optional[ObjectId]:
         """
         Save a single event to the database.
         
@@ -70,76 +199,106 @@ class DatabaseManager:
                 Optional: risk_increase, details, source, ip_address, etc.
         
         Returns:
-            True if successful, False otherwise
+            The new event's _id if successful (truthy), None otherwise
         """
-        if not self.is_connected():
-            return False
+        if self.client is None:
+            return None
         
         try:
+            now = datetime.now()
+            
             # Ensure timestamp is datetime object
             if isinstance(event_data.get('timestamp'), str):
-                event_data['timestamp'] = datetime.fromisoformat(event_data['timestamp'].replace('Z', '+00:00'))
+                event_data['timestamp'] = _parse_timestamp(event_data['timestamp'])
             elif not isinstance(event_data.get('timestamp'), datetime):
-                event_data['timestamp'] = datetime.now()
+                event_data['timestamp'] = now
             
             # Add metadata
-            event_data['created_at'] = datetime.now()
+            event_data['created_at'] = now
             event_data['processed'] = False  # Mark as unprocessed initially
             
-            self.events_collection.insert_one(event_data)
-            return True
+            return self.events_collection.insert_one(event_data).inserted_id
         except Exception as e:
-            print(f"Error saving event: {e}")
-            return False
+            logger.error("Error saving event: %s", e)
+            return None
     
-    def save_events_batch(self, events: List[Dict]) -> int:
+    def save_events_batch(self, events: List[Dict], durable: bool = True) -> int:
         """
         Save multiple events in a batch operation.
+        The insert is unordered: the server may apply documents in parallel,
+        and one rejected document does not stop the rest of the batch.
         
         Args:
             events: List of event dictionaries
+            durable: Wait for the server to acknowledge the insert. With False
+                the batch is sent without waiting, and rejected documents go
+                unreported
         
         Returns:
-            Number of events successfully saved
+            Number of events successfully saved (sent, when not durable)
         """
-        if not self.is_connected():
+        if self.client is None:
             return 0
         
         try:
-            # Process timestamps and add metadata
+            # Process timestamps and add metadata; one clock read serves the
+            # whole batch for created_at and missing timestamps
+            now = datetime.now()
+            parse_timestamp = _parse_timestamp
             for event in events:
-                if isinstance(event.get('timestamp'), str):
+                timestamp = event.get('timestamp')
+                if isinstance(timestamp, str):
                     try:
-                        event['timestamp'] = datetime.fromisoformat(event['timestamp'].replace('Z', '+00:00'))
-                    except:
-                        event['timestamp'] = datetime.now()
-                elif not isinstance(event.get('timestamp'), datetime):
-                    event['timestamp'] = datetime.now()
+                        event['timestamp'] = parse_timestamp(timestamp)
+                    except ValueError:
+                        event['timestamp'] = now
+                elif not isinstance(timestamp, datetime):
+                    event['timestamp'] = now
                 
-                event['created_at'] = datetime.now()
+                event['created_at'] = now
                 event['processed'] = False
             
-            result = self.events_collection.insert_many(events)
+            collection = self.events_collection if durable else self.unacknowledged_events_collection
+            result = collection.insert_many(events, ordered=False)
             return len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Some documents were rejected; the rest were still inserted
+            logger.error("Error saving events batch: %d events rejected", len(e.details.get('writeErrors', [])))
+            return e.details.get('nInserted', 0)
         except Exception as e:
-            print(f"Error saving events batch: {e}")
+            logger.error("Error saving events batch: %s", e)
             return 0
     
     def get_next_unprocessed_event(self) -> Optional[Dict]:
         """
         Get the next unprocessed event from the database.
-        Returns events in chronological order.
+        Returns events in chronological order. The event is marked processed
+        in the same call (see claim_next_event), so no separate
+        mark_event_processed round-trip is needed.
         
         Returns:
             Event dictionary or None if no events available
         """
-        if not self.is_connected():
+        return self.claim_next_event()
+    
+    def claim_next_event(self) -> Optional[Dict]:
+        """
+        Atomically take the oldest unprocessed event and mark it processed,
+        in one round-trip. Two readers can never claim the same event.
+        
+        Returns:
+            The claimed event dictionary or None if no events available
+        """
+        if self.client is None:
             return None
         
         try:
-            event = self.events_collection.find_one(
+            event = self.events_collection.find_one_and_update(
                 {"processed": False},
-                sort=[("timestamp", 1)]  # Sort by timestamp ascending
+                {"$set": {"processed": True, "processed_at": datetime.now()}},
+                projection=QUEUE_EVENT_FIELDS,
+                sort=[("timestamp", 1)],  # Oldest first, served by the (processed, timestamp) index
+                return_document=ReturnDocument.AFTER
             )
             
             if event:
@@ -148,33 +307,81 @@ class DatabaseManager:
             
             return event
         except Exception as e:
-            print(f"Error getting next event: {e}")
+            logger.error("Error claiming next event: %s", e)
             return None
     
+    def release_event(self, event_id: str) -> bool:
+        """
+        Return a claimed event to the unprocessed queue.
+        
+        Args:
+            event_id: MongoDB _id of the event (ObjectId or string)
+        
+        Returns:
+            True if successful
+        """
+        if self.client is None:
+            return False
+        
+        try:
+            self.events_collection.update_one(
+                {"_id": _object_id(event_id)},
+                {"$set": {"processed": False}, "$unset": {"processed_at": ""}}
+            )
+            return True
+        except Exception as e:
+            logger.error("Error releasing event: %s", e)
+            return False
+    
     def mark_event_processed(self, event_id: str) -> bool:
         """
         Mark an event as processed.
+        Events from claim_next_event / get_next_unprocessed_event are already
+        marked; this is kept for events handled by other means.
         
         Args:
-            event_id: MongoDB _id of the event
+            event_id: MongoDB _id of the event (ObjectId or string)
         
         Returns:
             True if successful
         """
-        if not self.is_connected():
+        if self.client is None:
             return False
         
         try:
             self.events_collection.update_one(
-                {"_id": ObjectId(event_id)},
+                {"_id": _object_id(event_id)},
                 {"$set": {"processed": True, "processed_at": datetime.now()}}
             )
             return True
         except Exception as e:
-            print(f"Error marking event processed: {e}")
+            logger.error("Error marking event processed: %s", e)
             return False
     
-    def save_incident(self, incident_data: Dict) -> bool:
+    def mark_events_processed_batch(self, event_ids: List) -> int:
+        """
+        Mark several events as processed with a single update.
+        
+        Args:
+            event_ids: MongoDB _ids of the events (ObjectIds or strings)
+        
+        Returns:
+            Number of events marked
+        """
+        if self.client is None or not event_ids:
+            return 0
+        
+        try:
+            result = self.events_collection.update_many(
+                {"_id": {"$in": [_object_id(event_id) for event_id in event_ids]}},
+                {"$set": {"processed": True, "processed_at": datetime.now()}}
+            )
+            return result.modified_count
+        except Exception as e:
+            logger.error("Error marking events processed: %s", e)
+            return 0
+    
+    def save_incident(self, incident_data: Dict) -> Optional[ObjectId]:
         """
         Save an incident to the database.
         
@@ -183,49 +390,68 @@ class DatabaseManager:
                 Required: timestamp, user_id, risk_score, message
         
         Returns:
-            True if successful
+            The new incident's _id if successful (truthy), None otherwise
         """
-        if not self.is_connected():
-            return False
+        if self.client is None:
+            return None
         
         try:
+            now = datetime.now()
             if isinstance(incident_data.get('timestamp'), str):
-                incident_data['timestamp'] = datetime.fromisoformat(incident_data['timestamp'].replace('Z', '+00:00'))
+                incident_data['timestamp'] = _parse_timestamp(incident_data['timestamp'])
             elif not isinstance(incident_data.get('timestamp'), datetime):
-                incident_data['timestamp'] = datetime.now()
+                incident_data['timestamp'] = now
             
-            incident_data['created_at'] = datetime.now()
-            self.incidents_collection.insert_one(incident_data)
-            return True
+            incident_data['created_at'] = now
+            return self.incidents_collection.insert_one(incident_data).inserted_id
         except Exception as e:
-            print(f"Error saving incident: {e}")
-            return False
+            logger.error("Error saving incident: %s", e)
+            return None
     
-    def get_all_incidents(self, limit: int = 100) -> List[Dict]:
+    def get_all_incidents(self, limit: int = 100, fields: Optional[Dict] = INCIDENT_FIELDS) -> List[Dict]:
         """
         Get all incidents from the database.
         
         Args:
             limit: Maximum number of incidents to retrieve
+            fields: Projection of fields to fetch (None for whole documents)
         
         Returns:
             List of incident dictionaries
         """
-        if not self.is_connected():
-            return []
+        return list(self.iter_incidents(limit, fields))
+    
+    def iter_incidents(self, limit: int = 100, fields: Optional[Dict] = INCIDENT_FIELDS) -> Iterator[Dict]:
+        """
+        Yield incidents from the database, newest first, one at a time as
+        the cursor returns them, so callers can stream them without holding
+        the whole result.
+        
+        Args:
+            limit: Maximum number of incidents to retrieve
+            fields: Projection of fields to fetch (None for whole documents)
+        
+        Yields:
+            Incident dictionaries
+        """
+        if self.client is None:
+            return
         
         try:
-            incidents = list(self.incidents_collection.find().sort("timestamp", -1).limit(limit))
-            for incident in incidents:
+            # One batch of `limit` documents avoids extra getMore round-trips
+            cursor = self.incidents_collection.find(projection=fields).sort("timestamp", -1).limit(limit).batch_size(limit)
+            for incident in cursor:
                 incident['_id'] = str(incident['_id'])
-            return incidents
+                yield incident
         except Exception as e:
-            print(f"Error getting incidents: {e}")
-            return []
+            logger.error("Error getting incidents: %s", e)
     
     def save_risk_scores(self, risk_scores: Dict[str, int]) -> bool:
         """
         Save current risk scores for all users.
+        Each user has one document keyed by user_id (_id), updated in place,
+        so the collection stays one document per user; all users are written
+        in a single bulk request.
         
         Args:
             risk_scores: Dictionary mapping user_id to risk_score
@@ -233,23 +459,27 @@ class DatabaseManager:
         Returns:
             True if successful
         """
-        if not self.is_connected():
+        if self.client is None:
             return False
         
+        if not risk_scores:
+            return True
+        
         try:
-            document = {
-                "timestamp": datetime.now(),
-                "risk_scores": risk_scores
-            }
-            self.risk_scores_collection.insert_one(document)
+            now = datetime.now()
+            operations = [
+                UpdateOne({"_id": user_id}, {"$set": {"risk_score": risk_score, "updated_at": now}}, upsert=True)
+                for user_id, risk_score in risk_scores.items()
+            ]
+            self.risk_scores_collection.bulk_write(operations, ordered=False)
             return True
         except Exception as e:
-            print(f"Error saving risk scores: {e}")
+            logger.error("Error saving risk scores: %s", e)
             return False
     
     def get_unprocessed_event_count(self) -> int:
-        """Get count of unprocessed events."""
-        if not self.is_connected():
+        """Get count of unprocessed events (counted from the partial queue index)."""
+        if self.client is None:
             return 0
         
         try:
@@ -258,34 +488,42 @@ class DatabaseManager:
             return 0
     
     def get_total_event_count(self) -> int:
-        """Get total count of events."""
-        if not self.is_connected():
+        """
+        Get total count of events, read from collection metadata rather than
+        by scanning (may be briefly off after an unclean shutdown).
+        """
+        if self.client is None:
             return 0
         
         try:
-            return self.events_collection.count_documents({})
+            return self.events_collection.estimated_document_count()
         except Exception:
             return 0
     
     def clear_processed_events(self) -> int:
         """
-        Remove all processed events from database.
-        Useful for cleanup.
+        Remove all processed events from database now.
+        Processed events also expire on their own after PROCESSED_EVENT_TTL;
+        this is for an immediate cleanup, such as a full reset.
         
         Returns:
             Number of events deleted
         """
-        if not self.is_connected():
+        if self.client is None:
             return 0
         
         try:
             result = self.events_collection.delete_many({"processed": True})
             return result.deleted_count
         except Exception as e:
-            print(f"Error clearing processed events: {e}")
+            logger.error("Error clearing processed events: %s", e)
             return 0
     
     def close(self):
-        """Close database connection."""
-        if self.client:
-            self.client.close()
+        """
+        Close database connection. The shared client is only closed once no
+        other DatabaseManager is using it.
+        """
+        if self.client is not None:
+            self.client = None
+            _release_client(self.connection_uri)
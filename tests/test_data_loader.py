@@ -0,0 +1,38 @@
+"""Tests for CSV event parsing in data_loader."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_loader import DataLoader
+
+
+def test_csv_cells_past_header_are_ignored():
+    csv_data = (
+        "user_id,activity,timestamp\n"
+        "user_A,normal,2024-01-01T00:00:00,EXTRA\n"
+        ",normal,2024-01-01T00:00:00,user_A\n"
+    )
+    events = list(DataLoader.iter_csv_events(csv_data, "test"))
+    
+    assert events == [{
+        'timestamp': '2024-01-01T00:00:00',
+        'user_id': 'user_A',
+        'activity': 'normal',
+        'source': 'test',
+        'risk_increase': 0
+    }]
+
+
+def test_csv_short_rows_leave_missing_columns_out():
+    csv_data = (
+        "user_id,activity,timestamp,details,ip_address\n"
+        "user_B,normal,2024-01-01T00:00:00\n"
+    )
+    events = list(DataLoader.iter_csv_events(csv_data))
+    
+    assert len(events) == 1
+    assert 'details' not in events[0]
+    assert 'ip_address' not in events[0]
+    assert events[0]['source'] == 'unknown'
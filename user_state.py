@@ -0,0 +1,140 @@
+"""
+User State Module
+=================
+This module holds the per-user state tracked by the application (risk
+scores, account status, security points) as NumPy arrays indexed by user
+position, with dictionary-style access by user_id.
+
+Keeping each field in one contiguous array lets whole-population updates
+(risk decay, statistics, AI feature vectors) run as single vectorized
+operations, while existing code keeps reading and writing state[user_id].
+"""
+
+from collections.abc import MutableMapping
+import numpy as np
+
+from config import USER_STATUS_ACTIVE, USER_STATUS_LOCKED
+
+
+# Status codes stored in UserStatuses; index = code
+STATUS_ACTIVE_CODE = 0
+STATUS_LOCKED_CODE = 1
+_STATUS_NAMES = (USER_STATUS_ACTIVE, USER_STATUS_LOCKED)
+_STATUS_CODES = {name: code for code, name in enumerate(_STATUS_NAMES)}
+
+
+class UserValues(MutableMapping):
+    """
+    Fixed set of users mapped to one NumPy array of values.
+    Users are added at construction only; deleting a user is not supported.
+    """
+
+    dtype = np.float64
+
+    def __init__(self, user_ids, initial=0):
+        """
+        Args:
+            user_ids: Iterable of user IDs, in display order
+            initial: Starting value for every user
+        """
+        self.index = {user_id: position for position, user_id in enumerate(user_ids)}
+        self.array = np.full(len(self.index), initial, dtype=self.dtype)
+
+    def __getitem__(self, user_id):
+        return self.array[self.index[user_id]].item()
+
+    def __setitem__(self, user_id, value):
+        self.array[self.index[user_id]] = value
+
+    def __delitem__(self, user_id):
+        raise TypeError(f"{type(self).__name__} has a fixed set of users")
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, user_id):
+        return user_id in self.index
+
+    def reset(self, value=0):
+        """Set every user's value at once."""
+        self.array.fill(value)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class RiskScores(UserValues):
+    """
+    User risk scores that also keep the total and maximum score up to date
+    as scores are assigned, so statistics and anomaly features don't rescan
+    every user. The maximum is only recomputed when the user holding it
+    drops below it.
+    """
+
+    dtype = np.int64
+
+    def __init__(self, user_ids, initial=0):
+        super().__init__(user_ids, initial)
+        self._recount()
+
+    def _recount(self):
+        self.total = int(self.array.sum())
+        self.max_score = int(self.array.max()) if len(self.array) else 0
+
+    def __setitem__(self, user_id, score):
+        position = self.index[user_id]
+        old_score = self.array[position].item()
+        self.array[position] = score
+        self.total += score - old_score
+        if score >= self.max_score:
+            self.max_score = score
+        elif old_score == self.max_score:
+            self.max_score = int(self.array.max())
+
+    def reset(self, value=0):
+        super().reset(value)
+        self._recount()
+
+    def decay(self, amount):
+        """
+        Lower every score by amount, flooring at zero.
+
+        Args:
+            amount: Points to subtract from each score
+
+        Returns:
+            Copy of the scores before the decay
+        """
+        old_scores = self.array.copy()
+        np.subtract(self.array, amount, out=self.array)
+        np.maximum(self.array, 0, out=self.array)
+        self._recount()
+        return old_scores
+
+    def average(self):
+        """Mean risk score, or 0.0 when there are no users."""
+        return self.total / len(self.array) if len(self.array) else 0.0
+
+
+class UserStatuses(UserValues):
+    """
+    User account statuses stored as small integer codes; reads and writes
+    use the USER_STATUS_* strings.
+    """
+
+    dtype = np.uint8
+
+    def __init__(self, user_ids, initial=USER_STATUS_ACTIVE):
+        super().__init__(user_ids, _STATUS_CODES[initial])
+
+    def __getitem__(self, user_id):
+        return _STATUS_NAMES[self.array[self.index[user_id]]]
+
+    def __setitem__(self, user_id, status):
+        self.array[self.index[user_id]] = _STATUS_CODES[status]
+
+    def reset(self, status=USER_STATUS_ACTIVE):
+        super().reset(_STATUS_CODES[status])